@@ -1,11 +1,16 @@
 """Core soundata classes
 """
 
+import collections
+import hashlib
+import itertools
 import json
 import os
+import pickle
 import sys
 import random
 import types
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, List, Optional
 
 import numpy as np
@@ -14,6 +19,7 @@ from soundata import download_utils
 from soundata import validate
 
 MAX_STR_LEN = 100
+METADATA_CACHE_DIR = ".soundata_cache"
 DOCS_URL = "https://soundata.readthedocs.io/en/stable/source/soundata.html"
 DISCLAIMER = """
 ******************************************************************************************
@@ -80,6 +86,85 @@ def copy_docs(original):
     return wrapper
 
 
+def load_cached_metadata(data_home, source_paths, build_metadata, version=None):
+    """Load a dataset's metadata from an on-disk cache, building it on a miss
+
+    The cache is a pickle stored in ``<data_home>/.soundata_cache``, keyed by
+    the modification time and size of the files or folders the metadata is
+    built from, so it is rebuilt whenever any of them changes. Caches left
+    over from previous versions of the same files are deleted. Nothing is
+    written when data_home or any of the source paths does not exist, and
+    failing to write the cache (e.g. a read-only data_home) is not an error.
+    A cache that cannot be loaded is rebuilt.
+
+    Args:
+        data_home (str): Local path where the dataset is stored
+        source_paths (list): paths the metadata is built from
+        build_metadata (function): function without arguments which builds
+            the metadata when it is not cached
+        version (str or None): format of the built metadata. Caches written
+            with a different version are rebuilt.
+
+    Returns:
+        the (possibly cached) result of build_metadata
+
+    """
+    stat_parts = []
+    sources_missing = False
+    for source_path in source_paths:
+        try:
+            stat = os.stat(source_path)
+            stat_parts.append("{}:{}".format(stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            stat_parts.append("missing")
+            sources_missing = True
+    if version is not None:
+        stat_parts.append("version:{}".format(version))
+    # caches of the same sources share a prefix, so stale ones can be found
+    prefix = "metadata_{}_".format(_md5_hexdigest("|".join(source_paths)))
+    cache_dir = os.path.join(data_home, METADATA_CACHE_DIR)
+    cache_path = os.path.join(
+        cache_dir, "{}{}.pkl".format(prefix, _md5_hexdigest("|".join(stat_parts)))
+    )
+
+    try:
+        with open(cache_path, "rb") as fhandle:
+            return pickle.load(fhandle)
+    except Exception:
+        # missing, truncated or stale (e.g. referencing a renamed class)
+        pass
+
+    metadata = build_metadata()
+    if sources_missing or not os.path.isdir(data_home):
+        return metadata
+
+    # write to a temporary file first so concurrent readers never see a
+    # partially written cache
+    tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "wb") as fhandle:
+            pickle.dump(metadata, fhandle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        for filename in os.listdir(cache_dir):
+            stale_path = os.path.join(cache_dir, filename)
+            if (
+                filename.startswith(prefix)
+                and filename.endswith(".pkl")
+                and stale_path != cache_path
+            ):
+                os.remove(stale_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return metadata
+
+
+def _md5_hexdigest(string):
+    return hashlib.md5(string.encode("utf-8")).hexdigest()
+
+
 ##### Core Classes #####
 
 
@@ -99,6 +184,10 @@ class Dataset(object):
 
     """
 
+    #: name of the Clip attribute holding the path of its events annotation
+    #: file, read by load_all_events. None if the dataset has no such files
+    _events_path_attribute: Optional[str] = None
+
     def __init__(
         self,
         data_home=None,
@@ -275,6 +364,107 @@ class Dataset(object):
             for clipgroup_id in self.clipgroup_ids
         }
 
+    def _event_labels(self):
+        """Get the event labels of all clips without building the clips
+
+        Hidden helper used by plot_hierarchical_distribution. Datasets whose
+        metadata holds each clip's labels override it.
+
+        Returns:
+            list or None: the event labels of all clips, or None if they can
+                only be read from the clips themselves
+
+        """
+        return None
+
+    def load_all_events(self, clip_ids=None, max_workers=16):
+        """Load the sound events of several clips at once
+
+        The annotation files are read concurrently by a pool of threads,
+        instead of one file at a time.
+
+        Args:
+            clip_ids (list or None): clip ids to load the events of. If None,
+                the events of all clips are loaded
+            max_workers (int): number of threads reading annotation files
+
+        Returns:
+            dict: {`clip_id`: annotations.Events}
+
+        Raises:
+            AttributeError: If the dataset has no events annotation files
+
+        """
+        if self._events_path_attribute is None:
+            raise AttributeError("This dataset does not have events annotation files")
+
+        clip_ids = self.clip_ids if clip_ids is None else list(clip_ids)
+        events_paths = [
+            getattr(self.clip(clip_id), self._events_path_attribute)
+            for clip_id in clip_ids
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            events = list(executor.map(self.load_events, events_paths))
+        return dict(zip(clip_ids, events))
+
+    def iter_audio(self, clip_ids=None, prefetch=4, num_workers=None):
+        """Iterate over the audio of several clips, decoding ahead in background threads
+
+        Up to ``prefetch`` clips are loaded ahead while the caller consumes
+        the current one, so file reads and decoding overlap with the caller's
+        own processing. However slowly the caller consumes them, iter_audio
+        holds at most ``prefetch + 1`` decoded clips at a time: the one being
+        consumed and those loaded ahead. Loaders that cache decoded audio
+        themselves, such as urbansound8k, may keep more alive.
+
+        Args:
+            clip_ids (list or None): clip ids to load, in order. If None, all
+                clips in the dataset are loaded
+            prefetch (int): maximum number of clips loaded ahead of the consumer
+            num_workers (int or None): number of threads loading clips. If
+                None, one thread per prefetched clip is used
+
+        Yields:
+            * str - the clip id
+            * tuple - the clip's audio, as returned by ``Clip.audio``
+
+        Raises:
+            ValueError: if prefetch is smaller than 1
+
+        """
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1, got {}".format(prefetch))
+        if clip_ids is None:
+            clip_ids = self.clip_ids
+
+        clip_ids = iter(clip_ids)
+        with ThreadPoolExecutor(max_workers=num_workers or prefetch) as executor:
+            pending = collections.deque(
+                (clip_id, executor.submit(self._clip_audio, clip_id))
+                for clip_id in itertools.islice(clip_ids, prefetch)
+            )
+            while pending:
+                clip_id, future = pending.popleft()
+                for next_clip_id in itertools.islice(clip_ids, 1):
+                    pending.append(
+                        (next_clip_id, executor.submit(self._clip_audio, next_clip_id))
+                    )
+                yield clip_id, future.result()
+
+    def _clip_audio(self, clip_id):
+        """Load the audio of a clip by clip_id.
+
+        Hidden helper function used by iter_audio.
+
+        Args:
+            clip_id (str): clip id of the clip
+
+        Returns:
+            tuple: the clip's audio, as returned by ``Clip.audio``
+
+        """
+        return self.clip(clip_id).audio
+
     def choice_clip(self):
         """Choose a random clip
 
@@ -308,7 +498,9 @@ class Dataset(object):
         print(self._license_info)
         print(DISCLAIMER)
 
-    def download(self, partial_download=None, force_overwrite=False, cleanup=False):
+    def download(
+        self, partial_download=None, force_overwrite=False, cleanup=False, max_workers=1
+    ):
         """Download data to `save_dir` and optionally print a message.
 
         Args:
@@ -319,6 +511,9 @@ class Dataset(object):
                 If True, existing files are overwritten by the downloaded files.
             cleanup (bool):
                 Whether to delete any zip/tar files after extracting.
+            max_workers (int):
+                Number of remotes downloaded concurrently, 1 by default. Some
+                hosts, such as Zenodo, rate-limit concurrent connections.
 
         Raises:
             ValueError: if invalid keys are passed to partial_download
@@ -333,6 +528,7 @@ class Dataset(object):
             info_message=self._download_info,
             force_overwrite=force_overwrite,
             cleanup=cleanup,
+            max_workers=max_workers,
         )
 
     def explore_dataset(self, clip_id=None):  # pragma: no cover
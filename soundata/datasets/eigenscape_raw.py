@@ -49,7 +49,6 @@ from typing import BinaryIO, Optional, TextIO, Tuple
 import librosa
 import numpy as np
 import csv
-import jams
 import glob
 import numbers
 from itertools import cycle
@@ -266,19 +265,27 @@ class Clip(core.Clip):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO, sr=None) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, sr=None, offset=0.0, duration=None
+) -> Tuple[np.ndarray, float]:
     """Load an EigenScape Raw audio file
 
     Args:
         fhandle (str or file-like): file-like object or path to audio file
         sr (int or None): sample rate for loaded audio, None by default, which
             uses the file's original sampling rate of 48000 without resampling.
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in seconds).
+            If None, the audio is loaded until the end of the file. Only the
+            requested segment is read from the file.
 
     Returns:
         * np.ndarray - the audio signal
         * float - The sample rate of the audio file
     """
-    audio, sr = librosa.load(fhandle, sr=sr, mono=False)
+    audio, sr = librosa.load(
+        fhandle, sr=sr, mono=False, offset=offset, duration=duration
+    )
     return audio, sr
 
 
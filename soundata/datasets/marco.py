@@ -53,7 +53,6 @@ from typing import BinaryIO, Optional, TextIO, Tuple
 import librosa
 import numpy as np
 import csv
-import jams
 import json
 import glob
 import numbers
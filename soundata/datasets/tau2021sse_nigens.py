@@ -71,7 +71,6 @@ from typing import BinaryIO, Optional, TextIO, Tuple
 import librosa
 import numpy as np
 import csv
-import jams
 import json
 import glob
 import numbers
@@ -228,7 +227,9 @@ class Clip(core.Clip):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO, sr=24000) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, sr=24000, offset=0.0, duration=None
+) -> Tuple[np.ndarray, float]:
     """Load a TAU NIGENS SSE 2021 audio file
 
     Args:
@@ -236,11 +237,17 @@ def load_audio(fhandle: BinaryIO, sr=24000) -> Tuple[np.ndarray, float]:
         sr (int or None): sample rate for loaded audio, 24000 Hz by default.
         If different from file's sample rate it will be resampled on load.
         Use None to load the file using its original sample rate (24000)
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in seconds).
+        If None, the audio is loaded until the end of the file. Only the
+        requested segment is read from the file.
     Returns:
         * np.ndarray - the audio signal
         * float - The sample rate of the audio file
     """
-    audio, sr = librosa.load(fhandle, sr=sr, mono=False)
+    audio, sr = librosa.load(
+        fhandle, sr=sr, mono=False, offset=offset, duration=duration
+    )
     return audio, sr
 
 
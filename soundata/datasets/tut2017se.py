@@ -157,8 +157,8 @@
 import os
 from typing import BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
+import soundfile as sf
 import csv
 
 # import jams
@@ -334,21 +334,53 @@ class Clip(core.Clip):
         )
 
 
-@io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO, sr=None) -> Tuple[np.ndarray, float]:
+@io.coerce_to_path_or_bytes_io
+def load_audio(
+    fhandle: BinaryIO,
+    sr=None,
+    dtype="float32",
+    channel_first=True,
+    offset=0.0,
+    duration=None,
+) -> Tuple[np.ndarray, float]:
     """Load a TUT Sound events 2017 audio file
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
         sr (int or None): sample rate for loaded audio, None by default, which
             uses the file's original sample rate of 44100 without resampling.
+        dtype (str): data type of the returned samples, one of "float64",
+            "float32" (default), "float16", "int32" or "int16". Integer types
+            return the raw PCM values, which takes half the memory of float32
+            for int16, and can only be used without resampling.
+        channel_first (bool): if True (default), the audio has shape
+            (n_channels, n_samples). If False, it keeps the decoder's
+            (n_samples, n_channels) layout, which avoids a transposed copy
+            when feeding libraries that expect channels last.
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in
+            seconds). None by default, which loads until the end of the file.
+            Only the requested frames are read from disk.
 
     Returns:
         * np.ndarray - the stereo audio signal
         * float - The sample rate of the audio file
 
     """
-    audio, sr = librosa.load(fhandle, sr=sr, mono=False)
+    read_dtype = io.audio_read_dtype(dtype)
+    with sf.SoundFile(fhandle) as sound_file:
+        file_sr = sound_file.samplerate
+        if offset:
+            sound_file.seek(int(offset * file_sr))
+        frames = -1 if duration is None else int(duration * file_sr)
+        audio = sound_file.read(frames, dtype=read_dtype)
+
+    audio, sr = io.resample_audio(audio, file_sr, sr, dtype, axis=0)
+
+    if dtype == "float16":
+        audio = audio.astype(np.float16, copy=False)
+    if channel_first:
+        audio = audio.T
     return audio, sr
 
 
@@ -386,6 +418,8 @@ def load_events(fhandle: TextIO) -> annotations.Events:
 class Dataset(core.Dataset):
     """The TUT Sound events 2017 dataset"""
 
+    _events_path_attribute = "annotations_path"
+
     def __init__(self, data_home=None, version="default"):
         super().__init__(
             data_home,
@@ -438,10 +472,13 @@ class Dataset(core.Dataset):
                 )
 
             with open(evaluation_setup_file) as csv_file:
-                csv_reader = csv.reader(csv_file, delimiter="\t")
-                for row in csv_reader:
-                    file_name = os.path.basename(row[0])
-                    clip_id = os.path.basename(file_name).replace(".wav", "")
+                # rows are either "<path>" or "<path>\t<scene>", so only the
+                # first tab-separated field is needed
+                for line in csv_file:
+                    file_path = line.split("\t", 1)[0].rstrip()
+                    if not file_path:
+                        continue
+                    clip_id = file_path.rpartition("/")[2][:-4]
                     metadata_index[clip_id] = {"split": split}
 
         return metadata_index
@@ -120,14 +120,15 @@
 
 """
 
+import copy
+import csv
+import functools
 import os
-from typing import BinaryIO, Optional, TextIO, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Optional, TextIO, Tuple, Union
 
-import librosa
 import numpy as np
-import csv
-import jams
-import glob
+import soundfile as sf
 
 from soundata import download_utils
 from soundata import jams_utils
@@ -169,6 +170,8 @@ REMOTES = {
 
 LICENSE_INFO = "Creative Commons Attribution 4.0 International"
 
+SPLITS = ["train", "validate", "test"]
+
 
 class Clip(core.Clip):
     """URBAN-SED Clip class
@@ -229,32 +232,80 @@ class Clip(core.Clip):
             jams.JAMS: the clip's data in jams format
 
         """
-        jam = jams.load(self.jams_path)
+        jam = copy.deepcopy(
+            _load_jams(self.jams_path, os.path.getmtime(self.jams_path))
+        )
         jam.annotations[0].annotation_metadata.data_source = "soundata"
         return jam
 
 
-@io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO, sr=None) -> Tuple[np.ndarray, float]:
+@functools.lru_cache(maxsize=2048)
+def _load_jams(jams_path, mtime):
+    # parsing and validating a JAMS file is slow, so each file is only loaded
+    # once per modification time. Callers get a deep copy of the cached object.
+    import jams
+
+    return jams.load(jams_path)
+
+
+@io.coerce_to_path_or_bytes_io
+def load_audio(
+    fhandle: BinaryIO, sr=None, stream=False, block_seconds=30, dtype="float32"
+) -> Tuple[np.ndarray, float]:
     """Load a UrbanSound8K audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
         sr (int or None): sample rate for loaded audio, None by default, which
             uses the file's original sample rate of 44100 without resampling.
+        stream (bool): if True, return a generator over consecutive blocks of
+            the audio instead of loading the whole file, so long files do not
+            have to fit in memory. Streamed audio is not resampled.
+        block_seconds (float): duration of each streamed block in seconds
+        dtype (str): data type of the returned samples, one of "float64",
+            "float32" (default), "float16", "int32" or "int16". Integer types
+            return the raw PCM values, which for the 16-bit URBAN-SED audio is
+            lossless with int16, and can only be used without resampling.
+
+    Raises:
+        ValueError: if dtype is invalid, or if sr differs from the file's
+            sample rate and either stream is True or dtype is an integer type
 
     Returns:
-        * np.ndarray - the mono audio signal
+        * np.ndarray - the mono audio signal, or a generator of mono audio
+          blocks if stream is True
         * float - The sample rate of the audio file
 
     """
-    audio, sr = librosa.load(fhandle, sr=sr, mono=True)
-    return audio, sr
+    read_dtype = io.audio_read_dtype(dtype)
+    if stream:
+        file_sr = sf.info(fhandle).samplerate
+        if sr is not None and sr != file_sr:
+            raise ValueError("Streamed audio cannot be resampled")
+        if not isinstance(fhandle, str):
+            fhandle.seek(0)
+        blocksize = int(block_seconds * file_sr)
+        return _stream_audio(fhandle, blocksize, read_dtype, dtype), file_sr
 
+    audio, file_sr = sf.read(fhandle, dtype=read_dtype)
+    audio, sr = io.resample_audio(io.downmix(audio, dtype), file_sr, sr, dtype)
+    return audio.astype(dtype, copy=False), sr
 
-@io.coerce_to_string_io
-def load_events(fhandle: TextIO) -> annotations.Events:
+
+def _stream_audio(fhandle, blocksize, read_dtype, dtype):
+    for block in sf.blocks(fhandle, blocksize=blocksize, dtype=read_dtype):
+        yield io.downmix(block, dtype).astype(dtype, copy=False)
+
+
+def load_events(
+    fhandle: Union[str, os.PathLike, TextIO]
+) -> Optional[annotations.Events]:
     """Load an URBAN-SED sound events annotation file
+
+    Files loaded by path are parsed once per process and cached (keyed by
+    path and modification time), so the returned object may be shared and
+    should not be modified in place.
+
     Args:
         fhandle (str or file-like): File-like object or path to the sound events annotation file
     Raises:
@@ -262,28 +313,59 @@ def load_events(fhandle: TextIO) -> annotations.Events:
     Returns:
         Events: sound events annotation data
     """
+    if isinstance(fhandle, (str, os.PathLike)):
+        txt_path = os.fspath(fhandle)
+        return _load_events_cached(txt_path, os.path.getmtime(txt_path))
+    return _load_events(fhandle)
 
-    times = []
-    labels = []
-    confidence = []
-    reader = csv.reader(fhandle, delimiter="\t")
-    for line in reader:
-        times.append([float(line[0]), float(line[1])])
-        labels.append(line[2])
-        confidence.append(1.0)
-
-    events_data = annotations.Events(
-        np.array(times), "seconds", labels, "open", np.array(confidence)
-    )
+
+@functools.lru_cache(maxsize=16384)
+def _load_events_cached(txt_path, mtime):
+    return _load_events(txt_path)
+
+
+@io.coerce_to_string_io
+def _load_events(fhandle: TextIO) -> annotations.Events:
+    # annotation files only have a handful of lines, which the csv module
+    # parses much faster than numpy or pandas given their per-call overhead
+    rows = list(csv.reader(fhandle, delimiter="\t"))
+    times = np.array([row[:2] for row in rows], dtype=float)
+    labels = [row[2] for row in rows]
+    confidence = np.ones(len(labels))
+
+    events_data = annotations.Events(times, "seconds", labels, "open", confidence)
     return events_data
 
 
+def _list_clip_ids(annotation_folder):
+    """List the ids of the clips annotated in an URBAN-SED annotation folder
+
+    Args:
+        annotation_folder (str): path to the annotation folder of a split
+
+    Returns:
+        list: sorted clip ids, empty if the folder does not exist
+
+    """
+    try:
+        with os.scandir(annotation_folder) as entries:
+            # directory order differs between filesystems, and filter_by_split
+            # returns clips in this order
+            return sorted(
+                entry.name[:-4] for entry in entries if entry.name.endswith(".txt")
+            )
+    except FileNotFoundError:
+        return []
+
+
 @core.docstring_inherit(core.Dataset)
 class Dataset(core.Dataset):
     """
     The URBAN-SED dataset
     """
 
+    _events_path_attribute = "txt_path"
+
     def __init__(self, data_home=None, version="default"):
         super().__init__(
             data_home,
@@ -300,18 +382,63 @@ class Dataset(core.Dataset):
     def load_audio(self, *args, **kwargs):
         return load_audio(*args, **kwargs)
 
-    @core.cached_property
-    def _metadata(self):
-        splits = ["train", "validate", "test"]
-        expected_sizes = [6000, 2000, 2000]
-        metadata_index = {}
+    @core.copy_docs(load_events)
+    def load_events(self, *args, **kwargs):
+        return load_events(*args, **kwargs)
+
+    def filter_by_split(self, split):
+        """Get the ids of the clips in a split
 
-        for split, es in zip(splits, expected_sizes):
-            annotation_folder = os.path.join(self.data_home, "annotations", split)
-            txtfiles = sorted(glob.glob(os.path.join(annotation_folder, "*.txt")))
+        Args:
+            split (str): one of "train", "validate" or "test"
 
-            for tf in txtfiles:
-                clip_id = os.path.basename(tf).replace(".txt", "")
-                metadata_index[clip_id] = {"split": split}
+        Raises:
+            ValueError: if split is not a valid split name
 
-        return metadata_index
+        Returns:
+            list: ids of the clips in the split
+
+        """
+        if split not in SPLITS:
+            raise ValueError(
+                "Invalid split {}, should be one of {}".format(split, SPLITS)
+            )
+        clip_ids, split_codes = self._split_columns
+        return clip_ids[split_codes == SPLITS.index(split)].tolist()
+
+    @core.cached_property
+    def _split_columns(self):
+        # columnar view of the metadata: an array of clip ids and a parallel
+        # array of split codes (indexes into SPLITS), for vectorized filtering
+        split_codes = {split: code for code, split in enumerate(SPLITS)}
+        clip_ids = np.array(list(self._metadata.keys()), dtype=object)
+        codes = np.fromiter(
+            (split_codes[metadata["split"]] for metadata in self._metadata.values()),
+            dtype=np.int8,
+            count=len(clip_ids),
+        )
+        return clip_ids, codes
+
+    @core.cached_property
+    def _metadata(self):
+        annotation_folders = [
+            os.path.join(self.data_home, "annotations", split) for split in SPLITS
+        ]
+
+        def build_metadata():
+            # the split folders are listed concurrently, as listing them is I/O bound
+            with ThreadPoolExecutor(max_workers=len(SPLITS)) as executor:
+                split_clip_ids = executor.map(_list_clip_ids, annotation_folders)
+
+            # clips of a split share a single metadata dict, which is read-only
+            return {
+                clip_id: split_metadata
+                for split_metadata, clip_ids in zip(
+                    ({"split": split} for split in SPLITS), split_clip_ids
+                )
+                for clip_id in clip_ids
+            }
+
+        return core.load_cached_metadata(
+            self.data_home, annotation_folders, build_metadata
+        )
@@ -126,12 +126,15 @@
 
 """
 
+import collections.abc
+import csv
+import functools
 import os
+import struct
 from typing import BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
-import csv
+import soundfile as sf
 
 from soundata import download_utils
 from soundata import jams_utils
@@ -174,6 +177,65 @@ REMOTES = {
 LICENSE_INFO = "Creative Commons Attribution Non Commercial 4.0 International"
 
 
+class ClipMetadata(collections.abc.Mapping):
+    """Metadata of an urbansound8k clip
+
+    The fields are attributes (``metadata.fold``), and the object is also a
+    read-only mapping from field names to values (``metadata["fold"]``,
+    ``"fold" in metadata``, ``dict(metadata)``), like the per-clip
+    dictionaries of other loaders. Fields are stored in slots rather than a
+    dictionary, which keeps the metadata of the 8732 clips compact.
+
+    """
+
+    __slots__ = (
+        "slice_file_name",
+        "freesound_id",
+        "freesound_start_time",
+        "freesound_end_time",
+        "salience",
+        "fold",
+        "class_id",
+        "class_label",
+    )
+
+    def __init__(
+        self,
+        slice_file_name,
+        freesound_id,
+        freesound_start_time,
+        freesound_end_time,
+        salience,
+        fold,
+        class_id,
+        class_label,
+    ):
+        self.slice_file_name = slice_file_name
+        self.freesound_id = freesound_id
+        self.freesound_start_time = freesound_start_time
+        self.freesound_end_time = freesound_end_time
+        self.salience = salience
+        self.fold = fold
+        self.class_id = class_id
+        self.class_label = class_label
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __repr__(self):
+        return "ClipMetadata({})".format(
+            ", ".join("{}={!r}".format(key, self[key]) for key in self)
+        )
+
+
 class Clip(core.Clip):
     """urbansound8k Clip class
 
@@ -201,6 +263,11 @@ class Clip(core.Clip):
 
         self.audio_path = self.get_path("audio")
 
+    @core.cached_property
+    def _clip_metadata(self):
+        # resolved once per clip, as every property below reads from it
+        return super()._clip_metadata
+
     @property
     def audio(self) -> Optional[Tuple[np.ndarray, float]]:
         """The clip's audio
@@ -210,7 +277,10 @@ class Clip(core.Clip):
             * float - sample rate
 
         """
-        return load_audio(self.audio_path)
+        audio, sr = _load_audio_cached(
+            self.audio_path, os.path.getmtime(self.audio_path)
+        )
+        return audio.copy(), sr
 
     @property
     def slice_file_name(self):
@@ -220,7 +290,7 @@ class Clip(core.Clip):
             * str - The name of the audio file. The name takes the following format: [fsID]-[classID]-[occurrenceID]-[sliceID].wav
 
         """
-        return self._clip_metadata.get("slice_file_name")
+        return self._clip_metadata.slice_file_name
 
     @property
     def freesound_id(self):
@@ -230,7 +300,7 @@ class Clip(core.Clip):
             * str - ID of the freesound.org recording from which this clip was taken
 
         """
-        return self._clip_metadata.get("freesound_id")
+        return self._clip_metadata.freesound_id
 
     @property
     def freesound_start_time(self):
@@ -240,7 +310,7 @@ class Clip(core.Clip):
             * float - start time in seconds of the clip in the original freesound recording
 
         """
-        return self._clip_metadata.get("freesound_start_time")
+        return self._clip_metadata.freesound_start_time
 
     @property
     def freesound_end_time(self):
@@ -250,7 +320,7 @@ class Clip(core.Clip):
             * float - end time in seconds of the clip in the original freesound recording
 
         """
-        return self._clip_metadata.get("freesound_end_time")
+        return self._clip_metadata.freesound_end_time
 
     @property
     def salience(self):
@@ -260,7 +330,7 @@ class Clip(core.Clip):
             * int - annotator estimate of class sailence in the clip: 1 = foreground, 2 = background
 
         """
-        return self._clip_metadata.get("salience")
+        return self._clip_metadata.salience
 
     @property
     def fold(self):
@@ -270,7 +340,7 @@ class Clip(core.Clip):
             * int - fold number (1-10) to which this clip is allocated. Use these folds for cross validation
 
         """
-        return self._clip_metadata.get("fold")
+        return self._clip_metadata.fold
 
     @property
     def class_id(self):
@@ -280,7 +350,7 @@ class Clip(core.Clip):
             * int - integer representation of the class label (0-9). See Dataset Info in the documentation for mapping
 
         """
-        return self._clip_metadata.get("class_id")
+        return self._clip_metadata.class_id
 
     @property
     def class_label(self):
@@ -290,19 +360,20 @@ class Clip(core.Clip):
             * str - string class name: air_conditioner, car_horn, children_playing, dog_bark, drilling, engine_idling, gun_shot, jackhammer, siren, street_music
 
         """
-        return self._clip_metadata.get("class_label")
+        return self._clip_metadata.class_label
 
     @property
     def tags(self):
         """The clip's tags.
 
+        The Tags object is shared by all clips of the same class and should
+        not be modified in place.
+
         Returns:
             * annotations.Tags - tag (label) of the clip + confidence. In UrbanSound8K every clip has one tag
 
         """
-        return annotations.Tags(
-            [self._clip_metadata.get("class_label")], "open", np.array([1.0])
-        )
+        return _class_tags(self._clip_metadata.class_label)
 
     def to_jams(self):
         """Get the clip's data in jams format
@@ -312,12 +383,30 @@ class Clip(core.Clip):
 
         """
         return jams_utils.jams_converter(
-            audio_path=self.audio_path, tags=self.tags, metadata=self._clip_metadata
+            audio_path=self.audio_path,
+            tags=self.tags,
+            metadata=self._clip_metadata,
         )
 
 
-@io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO, sr=44100) -> Tuple[np.ndarray, float]:
+@functools.lru_cache(maxsize=64)
+def _load_audio_cached(audio_path, mtime):
+    # decoding and resampling dominate, so recently used clips are kept
+    # (keyed by path and modification time); Clip.audio returns a copy
+    return load_audio(audio_path)
+
+
+@functools.lru_cache(maxsize=None)
+def _class_tags(class_label):
+    # there are only 10 classes, so clips share one Tags object per class
+    # label, which should not be modified in place
+    return annotations.Tags([class_label], "open", np.array([1.0]))
+
+
+@io.coerce_to_path_or_bytes_io
+def load_audio(
+    fhandle: BinaryIO, sr=44100, fast=False, dtype="float32"
+) -> Tuple[np.ndarray, float]:
     """Load a UrbanSound8K audio file.
 
     Args:
@@ -326,14 +415,99 @@ def load_audio(fhandle: BinaryIO, sr=44100) -> Tuple[np.ndarray, float]:
             If different from file's sample rate it will be resampled on load.
             Use None to load the file using its original sample rate (sample rate
             varies from file to file).
+        fast (bool): if True and fhandle is a path to a 16-bit PCM WAV file
+            that needs no resampling, its samples are memory-mapped and
+            converted directly instead of going through the decoder. Other
+            files are loaded as usual.
+        dtype (str): data type of the returned samples, one of "float64",
+            "float32" (default), "float16", "int32" or "int16". Integer types
+            return the raw PCM values and can only be used without resampling,
+            i.e. with sr=None or sr equal to the file's sample rate.
+
+    Raises:
+        ValueError: if dtype is invalid, or if dtype is an integer type and
+            the audio would have to be resampled
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    audio, sr = librosa.load(fhandle, sr=sr, mono=True)
-    return audio, sr
+    read_dtype = io.audio_read_dtype(dtype)
+    pcm16 = (
+        _map_pcm16_wav(fhandle)
+        if fast and read_dtype != "int32" and isinstance(fhandle, str)
+        else None
+    )
+    if pcm16 is not None and (sr is None or sr == pcm16[1]):
+        samples, file_sr = pcm16
+        if read_dtype == "int16":
+            audio = np.array(samples)
+        else:
+            audio = samples.astype(read_dtype) * np.array(1.0 / 32768, dtype=read_dtype)
+    else:
+        audio, file_sr = sf.read(fhandle, dtype=read_dtype)
+    audio, sr = io.resample_audio(io.downmix(audio, dtype), file_sr, sr, dtype)
+    return audio.astype(dtype, copy=False), sr
+
+
+def _map_pcm16_wav(audio_path):
+    """Memory-map the samples of a 16-bit PCM WAV file
+
+    Args:
+        audio_path (str): path to the audio file
+
+    Returns:
+        * np.memmap - int16 samples with shape (n_samples, n_channels)
+        * int - sample rate
+        or None if the file is not a 16-bit PCM WAV file
+
+    """
+    fmt = None
+    with open(audio_path, "rb") as fhandle:
+        header = fhandle.read(12)
+        if len(header) < 12:
+            return None
+        riff, _, wave = struct.unpack("<4sI4s", header)
+        if riff != b"RIFF" or wave != b"WAVE":
+            return None
+
+        while True:
+            chunk_header = fhandle.read(8)
+            if len(chunk_header) < 8:
+                return None
+            chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+            if chunk_id == b"data":
+                data_offset = fhandle.tell()
+                file_size = os.fstat(fhandle.fileno()).st_size
+                data_size = min(chunk_size, file_size - data_offset)
+                break
+            chunk = fhandle.read(chunk_size + chunk_size % 2)
+            if chunk_id == b"fmt " and len(chunk) >= 16:
+                fmt = struct.unpack("<HHIIHH", chunk[:16])
+
+    if fmt is None:
+        return None
+    format_tag, n_channels, file_sr, _, block_align, bits_per_sample = fmt
+    if (
+        format_tag != 1
+        or bits_per_sample != 16
+        or n_channels == 0
+        or block_align != 2 * n_channels
+    ):
+        return None
+    n_samples = data_size // block_align
+    if n_samples == 0:
+        return None
+
+    samples = np.memmap(
+        audio_path,
+        dtype="<i2",
+        mode="r",
+        offset=data_offset,
+        shape=(n_samples, n_channels),
+    )
+    return samples, file_sr
 
 
 @core.docstring_inherit(core.Dataset)
@@ -358,6 +532,9 @@ class Dataset(core.Dataset):
     def load_audio(self, *args, **kwargs):
         return load_audio(*args, **kwargs)
 
+    def _event_labels(self):
+        return [self._metadata[clip_id].class_label for clip_id in self._index["clips"]]
+
     @core.cached_property
     def _metadata(self):
         metadata_path = os.path.join(self.data_home, "metadata", "UrbanSound8K.csv")
@@ -365,26 +542,27 @@ class Dataset(core.Dataset):
         if not os.path.exists(metadata_path):
             raise FileNotFoundError("Metadata not found. Did you run .download()?")
 
-        with open(metadata_path, "r") as fhandle:
-            reader = csv.reader(fhandle, delimiter=",")
-            raw_data = []
-            for line in reader:
-                if line[0] != "slice_file_name":
-                    raw_data.append(line)
-
-        metadata_index = {}
-        for line in raw_data:
-            clip_id = line[0].replace(".wav", "")
-
-            metadata_index[clip_id] = {
-                "slice_file_name": line[0],
-                "freesound_id": line[1],
-                "freesound_start_time": float(line[2]),
-                "freesound_end_time": float(line[3]),
-                "salience": int(line[4]),
-                "fold": int(line[5]),
-                "class_id": int(line[6]),
-                "class_label": line[7],
-            }
-
-        return metadata_index
+        def build_metadata():
+            metadata_index = {}
+            # there are only 10 class labels, so their strings are shared
+            class_labels = {}
+            with open(metadata_path, newline="") as fhandle:
+                reader = csv.reader(fhandle)
+                next(reader)
+                for line in reader:
+                    metadata_index[line[0][:-4]] = ClipMetadata(
+                        slice_file_name=line[0],
+                        freesound_id=line[1],
+                        freesound_start_time=float(line[2]),
+                        freesound_end_time=float(line[3]),
+                        salience=int(line[4]),
+                        fold=int(line[5]),
+                        class_id=int(line[6]),
+                        class_label=class_labels.setdefault(line[7], line[7]),
+                    )
+
+            return metadata_index
+
+        return core.load_cached_metadata(
+            self.data_home, [metadata_path], build_metadata, version="ClipMetadata-2"
+        )
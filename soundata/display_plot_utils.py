@@ -1,17 +1,15 @@
 # Audio Processing and Playback
-from pydub import AudioSegment  # For manipulating audio files
-from pydub.playback import play  # For playing audio files
-import simpleaudio as sa  # Alternative library for audio playback
+import simpleaudio as sa  # For audio playback
 import librosa  # For advanced audio analysis
+import soundfile as sf  # For reading audio file headers
 
 # Multithreading and Time Management
 import threading  # For running processes in parallel
+from concurrent.futures import ThreadPoolExecutor  # For parallel file access
 import time  # For handling time-related functions
 
 # Data Handling and Visualization
-import pandas as pd  # For handling and analyzing data structures
 import numpy as np  # For numerical operations
-import seaborn as sns  # For statistical data visualization
 import matplotlib.pyplot as plt  # For creating static, animated, and interactive visualizations
 
 # User Interface and Widgets
@@ -28,6 +26,7 @@ from ipywidgets import (
 from IPython.display import display  # For displaying widgets in IPython environments
 
 # Miscellaneous
+from collections import Counter  # For counting values
 from functools import lru_cache  # For caching function call results
 from tqdm import tqdm  # For displaying progress bars
 
@@ -159,21 +158,36 @@ def compute_clip_statistics(self):
     Calculates statistics such as total duration, mean duration, median duration, standard deviation,
     minimum duration, maximum duration, and total clip count.
     """
-    durations = [
-        len(self.clip(c_id).audio[0]) / self.clip(c_id).audio[1]
-        for c_id in tqdm(
-            list(self._index["clips"].keys()), desc="Calculating durations"
+    clip_ids = list(self._index["clips"].keys())
+    # Durations are read from the audio file headers where possible, which is
+    # I/O bound, so the clips are processed by a pool of threads
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        durations = np.fromiter(
+            (
+                duration
+                for duration in tqdm(
+                    executor.map(lambda c_id: clip_duration(self, c_id), clip_ids),
+                    total=len(clip_ids),
+                    desc="Calculating durations",
+                    # header reads are fast, so only refresh the bar every 1%
+                    miniters=max(1, len(clip_ids) // 100),
+                    mininterval=0.1,
+                )
+                if duration is not None
+            ),
+            dtype=float,
         )
-        if hasattr(self.clip(c_id), "audio")  # Adding the check here
-    ]
 
-    # Calculate statistics
-    total_duration = sum(durations)
-    mean_duration = np.mean(durations)
+    if not len(durations):
+        raise ValueError("No clip durations to compute statistics from.")
+
+    # Calculate statistics on the array, without converting the durations each time
+    total_duration = durations.sum()
+    mean_duration = durations.mean()
     median_duration = np.median(durations)
-    std_deviation = np.std(durations)
-    min_duration = np.min(durations)
-    max_duration = np.max(durations)
+    std_deviation = durations.std()
+    min_duration = durations.min()
+    max_duration = durations.max()
 
     return {
         "durations": durations,
@@ -186,6 +200,35 @@ def compute_clip_statistics(self):
     }
 
 
+def clip_duration(self, clip_id):
+    """Get the duration of a clip in seconds.
+
+    Args:
+        self:
+            Reference to the current instance of the class.
+        clip_id (str):
+            The identifier of the clip.
+
+    Returns:
+        float or None: Duration of the clip in seconds, or None if the clip has no audio.
+
+    Reads the duration from the audio file header when the file format is supported by
+    soundfile, and falls back to decoding the clip's audio otherwise.
+    """
+    clip = self.clip(clip_id)
+    audio_path = getattr(clip, "audio_path", None)
+    if isinstance(audio_path, str):
+        try:
+            info = sf.info(audio_path)
+            return info.frames / info.samplerate
+        except RuntimeError:  # Unsupported format, decode the audio instead
+            pass
+    if not hasattr(clip, "audio"):
+        return None
+    audio, sr = clip.audio
+    return len(audio) / sr
+
+
 def plot_clip_durations(self):
     """Plot the distribution of clip durations in the dataset.
 
@@ -289,14 +332,16 @@ def plot_distribution(data, title, x_label, y_label, axes, subplot_position):
 
     Plots the distribution of data with count labels and adjusts font sizes.
     """
-    my_palette = sns.color_palette("light:b", as_cmap=False)
     my_palette = ["#404040", "#126782", "#C9C9C9"]
-    sns.countplot(
-        y=data,
-        order=pd.value_counts(data).index,
-        palette=my_palette,
-        ax=axes[subplot_position],
+    # Count the values in a single pass and draw the bars directly, most frequent first
+    value_counts = Counter(data).most_common()
+    axes[subplot_position].barh(
+        range(len(value_counts)),
+        [count for _, count in value_counts],
+        color=[my_palette[i % len(my_palette)] for i in range(len(value_counts))],
+        tick_label=[str(value) for value, _ in value_counts],
     )
+    axes[subplot_position].invert_yaxis()
     axes[subplot_position].set_title(title, fontsize=8)
     axes[subplot_position].set_xlabel(x_label, fontsize=6)
     axes[subplot_position].set_ylabel(y_label, fontsize=6)
@@ -338,14 +383,17 @@ def plot_hierarchical_distribution(self):
     plt.figure(figsize=(6 * plot_count, 4))
     axes = [plt.subplot(1, plot_count, i + 1) for i in range(plot_count)]
 
-    # Plot Event Distribution
-    events = []
-    for clip_id in self._index["clips"]:
-        clip = self.clip(clip_id)
-        if hasattr(clip, "tags") and hasattr(clip.tags, "labels"):
-            events.extend(clip.tags.labels)
-        elif hasattr(clip, "events") and hasattr(clip.events, "labels"):
-            events.extend(clip.events.labels)
+    # Plot Event Distribution, reading the labels straight from the metadata when
+    # the dataset provides them there, instead of building each clip
+    events = self._event_labels()
+    if events is None:
+        events = []
+        for clip_id in self._index["clips"]:
+            clip = self.clip(clip_id)
+            if hasattr(clip, "tags") and hasattr(clip.tags, "labels"):
+                events.extend(clip.tags.labels)
+            elif hasattr(clip, "events") and hasattr(clip.events, "labels"):
+                events.extend(clip.events.labels)
 
     plot_distribution(
         events, "Event Distribution in the Dataset", "Count", "Event", axes, 0
@@ -391,12 +439,12 @@ def plot_hierarchical_distribution(self):
     print("\n")
 
 
-def play_segment(audio_segment, start_time, stop_event, sr):
+def play_segment(audio_playback, start_time, stop_event, sr):
     """Play an audio segment.
 
     Args:
-        audio_segment (AudioSegment):
-            Audio segment to be played.
+        audio_playback (np.ndarray):
+            Mono int16 audio samples to be played.
         start_time (float):
             Start time in seconds.
         stop_event (Event):
@@ -404,14 +452,15 @@ def play_segment(audio_segment, start_time, stop_event, sr):
         sr (int):
             Sample rate.
 
-    Plays an audio segment from the specified start time until the stop event is set.
+    Plays up to 1 minute of audio from the specified start time until the stop event is set.
     """
     try:
-        segment_start = start_time * 1000  # Convert to milliseconds
-        segment_end = segment_start + 60 * 1000
-        segment = audio_segment[segment_start:segment_end]
+        segment_start = int(start_time * sr)
+        segment_end = segment_start + 60 * sr
+        # A contiguous slice of the int16 array is passed as is, without copying
+        segment = audio_playback[segment_start:segment_end]
 
-        play_obj = sa.play_buffer(segment.raw_data, 1, 2, sr)
+        play_obj = sa.play_buffer(segment, 1, 2, sr)
 
         while play_obj.is_playing():
             if stop_event.is_set():
@@ -423,9 +472,17 @@ def play_segment(audio_segment, start_time, stop_event, sr):
 
 
 def update_line(
-    playing, current_time, duration, current_time_lock, line1, line2, fig, step=0.1
+    playing,
+    current_time,
+    duration,
+    current_time_lock,
+    line1,
+    line2,
+    fig,
+    timer,
+    step=0.1,
 ):
-    """Update the position of a vertical line on a plot.
+    """Advance the position of the vertical lines on a plot by one timer tick.
 
     Args:
         playing (list):
@@ -442,23 +499,29 @@ def update_line(
             Another line to be updated.
         fig (Figure):
             Figure containing the plot.
+        timer (TimerBase):
+            Canvas timer calling this function every ``step`` seconds.
         step (float, optional):
-            Step size for updating the line position. Defaults to 0.1.
+            Time between timer ticks in seconds. Defaults to 0.1.
 
-    Updates the position of the vertical lines on the plot while audio is playing.
+    Called by the figure's canvas timer, so the plot is only redrawn from the GUI event
+    loop. Stops the timer once audio is no longer playing.
     """
     try:
-        while playing[0]:
-            with current_time_lock:
-                current_time[0] += step
-                if current_time[0] > duration:
-                    playing[0] = False
-                    current_time[0] = 0.0
-            line1.set_xdata([current_time[0], current_time[0]])
-            line2.set_xdata([current_time[0], current_time[0]])
-            fig.canvas.draw_idle()
-            time.sleep(step)
+        if not playing[0]:
+            timer.stop()
+            return
+        with current_time_lock:
+            current_time[0] += step
+            if current_time[0] > duration:
+                playing[0] = False
+                current_time[0] = 0.0
+                timer.stop()
+        line1.set_xdata([current_time[0], current_time[0]])
+        line2.set_xdata([current_time[0], current_time[0]])
+        fig.canvas.draw_idle()
     except Exception as e:
+        timer.stop()
         print(f"Error in update_line: {e}")
 
 
@@ -487,7 +550,7 @@ def on_play_pause_clicked(
         play_segment_function (function):
             Function to play an audio segment.
         update_line_function (function):
-            Function to update the position of a vertical line on the plot.
+            Function starting the timer that moves the vertical lines on the plot.
 
     Handles the play/pause button click event to control audio playback.
     """
@@ -505,8 +568,7 @@ def on_play_pause_clicked(
             target=play_segment_function, args=(current_time[0],)
         )
         play_thread[0].start()
-        update_line_thread = threading.Thread(target=update_line_function)
-        update_line_thread.start()
+        update_line_function()
 
 
 def on_reset_clicked(
@@ -607,6 +669,44 @@ def on_slider_changed(
     fig.canvas.draw_idle()
 
 
+def waveform_envelope(audio, n_bins=2000):
+    """Reduce an audio signal to its min/max envelope for plotting.
+
+    Args:
+        audio (np.ndarray):
+            Audio signal.
+        n_bins (int, optional):
+            Number of bins the signal is split into. Defaults to 2000.
+
+    Returns:
+        np.ndarray: Interleaved minimum and maximum of each bin, or the signal itself
+        if it is too short to be reduced.
+    """
+    step = len(audio) // n_bins
+    if step < 2:
+        return audio
+    frames = audio[: step * n_bins].reshape(n_bins, step)
+    return np.stack([frames.min(axis=1), frames.max(axis=1)], axis=1).ravel()
+
+
+@lru_cache(maxsize=8)
+def mel_basis(sr, n_fft, n_mels):
+    """Get a mel filterbank, cached for repeated calls with the same parameters.
+
+    Args:
+        sr (int):
+            Sample rate.
+        n_fft (int):
+            FFT window size.
+        n_mels (int):
+            Number of mel bands.
+
+    Returns:
+        np.ndarray: Mel filterbank of shape (n_mels, 1 + n_fft // 2).
+    """
+    return librosa.filters.mel(sr=sr, n_fft=n_fft, n_mels=n_mels)
+
+
 def visualize_audio(self, clip_id):
     """Visualize audio data for a specified clip.
 
@@ -619,9 +719,8 @@ def visualize_audio(self, clip_id):
     Displays audio waveform, a Mel spectrogram, and provides playback controls.
     """
     if clip_id is None:  # Use the local variable
-        clip_id = np.random.choice(
-            list(self._index["clips"].keys())
-        )  # Modify the local variable
+        # clip_ids is cached by the dataset, so the id list is not rebuilt each call
+        clip_id = np.random.choice(self.clip_ids)  # Modify the local variable
     clip = self.clip(clip_id)  # Use the local variable
 
     stop_event = threading.Event()
@@ -630,14 +729,14 @@ def visualize_audio(self, clip_id):
     audio, sr = clip.audio
     duration = len(audio) / sr
 
-    audio = audio / np.max(np.abs(audio))
+    # Normalize to a peak of 1, without allocating an absolute value copy
+    peak = max(np.max(audio), -np.min(audio))
+    if peak > 0:
+        audio = audio * (1.0 / peak)
 
-    # Convert to int16 for playback
-    audio_playback = np.int16(audio * 32767)
-
-    audio_segment = AudioSegment(
-        audio_playback.tobytes(), frame_rate=sr, sample_width=2, channels=1
-    )
+    # Convert to int16 for playback, scaling straight into the int16 buffer
+    audio_playback = np.empty(audio.shape, dtype=np.int16)
+    np.multiply(audio, 32767, out=audio_playback, casting="unsafe")
 
     # Truncate the audio to a maximum duration (e.g., 1 minute)
     max_duration_secs = 60
@@ -645,26 +744,45 @@ def visualize_audio(self, clip_id):
     audio = audio[: int(max_duration_secs * sr)]
     duration = min(duration, max_duration_secs)
 
-    # Compute the Mel spectrogram
-    S = librosa.feature.melspectrogram(y=audio, sr=sr)
+    # Compute the Mel spectrogram, reusing the mel filterbank across calls
+    n_fft, hop_length, n_mels = 2048, 512, 128
+    power_spectrum = (
+        np.abs(librosa.stft(audio, n_fft=n_fft, hop_length=hop_length)) ** 2
+    )
+    S = mel_basis(sr, n_fft, n_mels) @ power_spectrum
     log_S = librosa.power_to_db(S, ref=np.max)
 
     # Update the figure and axes to show both plots
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(9, 4))
     # Plotting the waveform
-    ax1.plot(np.linspace(0, duration, len(audio)), audio)
+    # Only plot the min/max envelope, the figure is far narrower than the signal
+    envelope = waveform_envelope(audio)
+    ax1.plot(np.linspace(0, duration, len(envelope)), envelope)
     ax1.set_title(f"Audio waveform for clip: {clip_id}", fontsize=8)
     ax1.set_xlabel("Time (s)", fontsize=8)
     ax1.set_ylabel("Amplitude", fontsize=8)
     ax1.set_xlim(0, duration)
-    (line1,) = ax1.plot([0, 0], [min(audio), max(audio)], color="#C9C9C9")
+    (line1,) = ax1.plot([0, 0], [np.min(audio), np.max(audio)], color="#C9C9C9")
 
     # Adjusting the font size for axis labels
     for label in ax1.get_xticklabels() + ax1.get_yticklabels():
         label.set_fontsize(8)
 
     # Plotting the Mel spectrogram
-    im = librosa.display.specshow(log_S, sr=sr, x_axis="time", y_axis="mel", ax=ax2)
+    # Drawn as an image rather than with librosa's specshow, which builds a mesh with
+    # one quad per bin. Rows are evenly spaced mel bands, labelled with their Hz value
+    im = ax2.imshow(
+        log_S,
+        aspect="auto",
+        origin="lower",
+        interpolation="nearest",
+        cmap="magma",
+        extent=[0, log_S.shape[1] * hop_length / sr, 0, n_mels],
+    )
+    mel_frequencies = librosa.mel_frequencies(n_mels=n_mels, fmax=sr / 2)
+    mel_ticks = np.linspace(0, n_mels - 1, 6).astype(int)
+    ax2.set_yticks(mel_ticks + 0.5)
+    ax2.set_yticklabels([f"{mel_frequencies[tick]:.0f}" for tick in mel_ticks])
     ax2.set_title("Mel spectrogram", fontsize=8)
     ax2.set_xlim(0, duration)
     (line2,) = ax2.plot([0, 0], ax2.get_ylim(), color="#126782", linestyle="--")
@@ -691,6 +809,23 @@ def visualize_audio(self, clip_id):
     current_time = [0.0]
     play_thread = [None]
 
+    # The playback position is moved by a canvas timer, which runs its callback on the
+    # GUI event loop instead of redrawing the figure from a separate thread
+    step = 0.1
+    timer = fig.canvas.new_timer(interval=int(step * 1000))
+    timer.add_callback(
+        update_line,
+        playing,
+        current_time,
+        duration,
+        current_time_lock,
+        line1,
+        line2,
+        fig,
+        timer,
+        step,
+    )
+
     # Create UI elements
     slider = FloatSlider(
         value=0.0,
@@ -711,10 +846,8 @@ def visualize_audio(self, clip_id):
             play_thread,
             stop_event,
             play_pause_button,
-            lambda start_time: play_segment(audio_segment, start_time, stop_event, sr),
-            lambda: update_line(
-                playing, current_time, duration, current_time_lock, line1, line2, fig
-            ),
+            lambda start_time: play_segment(audio_playback, start_time, stop_event, sr),
+            timer.start,
         )
     )
     reset_button.on_click(
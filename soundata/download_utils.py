@@ -2,13 +2,19 @@
 """
 
 import glob
+import hashlib
 import logging
 import os
 import shutil
 import tarfile
-import urllib
+import threading
+import urllib.error
+import urllib.request
 import zipfile
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Set
+
 import py7zr
 from tqdm import tqdm
 
@@ -16,6 +22,10 @@ from soundata.validate import md5
 
 logging.basicConfig(format="%(levelname)s: %(message)s", level=logging.INFO)
 
+# remotes are downloaded concurrently, but archives are extracted one at a
+# time, as they often unpack into the same directories
+_EXTRACT_LOCK = threading.Lock()
+
 
 class RemoteFileMetadata(object):
     """The metadata for a remote file
@@ -48,6 +58,7 @@ def downloader(
     info_message=None,
     force_overwrite=False,
     cleanup=False,
+    max_workers=1,
 ):
     """Download data to `save_dir` and optionally log a message
 
@@ -71,6 +82,9 @@ def downloader(
             If True, existing files are overwritten by the downloaded files.
         cleanup (bool):
             Whether to delete the zip/tar file after extracting.
+        max_workers (int):
+            Number of remotes downloaded concurrently, 1 by default. Some
+            hosts, such as Zenodo, rate-limit concurrent connections.
     """
     if not os.path.exists(save_dir):
         os.makedirs(save_dir)
@@ -124,58 +138,103 @@ def downloader(
             logging.info("Downloading {} to {}".format(objs_to_download, save_dir))
 
         for k in objs_to_download:
-            if isinstance(remotes[k], list):
-                if all([remote.filename[-4:-2] == ".z" for remote in remotes[k]]):
-                    download_multipart_zip(
-                        remotes[k], save_dir, force_overwrite, cleanup
+            if isinstance(remotes[k], list) and not all(
+                [remote.filename[-4:-2] == ".z" for remote in remotes[k]]
+            ):
+                raise NotImplementedError("Only multipart zip supported.")
+
+        # downloads are bound by network latency rather than bandwidth, so
+        # several remotes can be fetched at once
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(objs_to_download)))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _download_remote, k, remotes[k], save_dir, force_overwrite, cleanup
+                )
+                for k in objs_to_download
+            ]
+            for future in futures:
+                future.result()
+
+        for k in objs_to_download:
+            if not isinstance(remotes[k], list) and remotes[k].unpack_directories:
+                for src_dir in remotes[k].unpack_directories:
+                    # path to destination directory
+                    destination_dir = (
+                        os.path.join(save_dir, remotes[k].destination_dir)
+                        if remotes[k].destination_dir
+                        else save_dir
                     )
-                else:
-                    raise NotImplementedError("Only multipart zip supported.")
-
-            else:
-                logging.info("[{}] downloading {}".format(k, remotes[k].filename))
-                extension = os.path.splitext(remotes[k].filename)[-1]
-                if ".zip" in extension:
-                    download_zip_file(remotes[k], save_dir, force_overwrite, cleanup)
-                elif ".gz" in extension or ".tar" in extension or ".bz2" in extension:
-                    download_tar_file(remotes[k], save_dir, force_overwrite, cleanup)
-                elif ".7z" in extension:
-                    download_7z_file(remotes[k], save_dir, force_overwrite, cleanup)
-                else:
-                    download_from_remote(remotes[k], save_dir, force_overwrite)
-
-                if remotes[k].unpack_directories:
-                    for src_dir in remotes[k].unpack_directories:
-                        # path to destination directory
-                        destination_dir = (
-                            os.path.join(save_dir, remotes[k].destination_dir)
-                            if remotes[k].destination_dir
-                            else save_dir
+                    # path to directory to unpack
+                    source_dir = os.path.join(destination_dir, src_dir)
+
+                    if not os.path.exists(source_dir):
+                        logging.info(
+                            "Data not downloaded, because it probably already exists on your computer. "
+                            + "Run .validate() to check, or rerun with force_overwrite=True to delete any "
+                            + "existing files and download from scratch"
                         )
-                        # path to directory to unpack
-                        source_dir = os.path.join(destination_dir, src_dir)
-
-                        if not os.path.exists(source_dir):
-                            logging.info(
-                                "Data not downloaded, because it probably already exists on your computer. "
-                                + "Run .validate() to check, or rerun with force_overwrite=True to delete any "
-                                + "existing files and download from scratch"
-                            )
-                            return
+                        return
 
-                        move_directory_contents(source_dir, destination_dir)
+                    move_directory_contents(source_dir, destination_dir)
 
     if info_message is not None:
         logging.info(info_message.format(save_dir))
 
 
+def _download_remote(key, remote, save_dir, force_overwrite, cleanup):
+    """Download (and extract, for archives) the remote of a single key
+
+    Args:
+        key (str): the key of the remote in the remotes dictionary
+        remote (RemoteFileMetadata or list): the remote, or the list of
+            parts of a multipart zip file
+        save_dir (str): Path to save downloaded file
+        force_overwrite (bool): If True, overwrites existing files
+        cleanup (bool): If True, remove archives after extracting them
+
+    """
+    if isinstance(remote, list):
+        download_multipart_zip(remote, save_dir, force_overwrite, cleanup)
+        return
+
+    logging.info("[{}] downloading {}".format(key, remote.filename))
+    extension = os.path.splitext(remote.filename)[-1]
+    if ".zip" in extension:
+        download_zip_file(remote, save_dir, force_overwrite, cleanup)
+    elif ".gz" in extension or ".tar" in extension or ".bz2" in extension:
+        download_tar_file(remote, save_dir, force_overwrite, cleanup)
+    elif ".7z" in extension:
+        download_7z_file(remote, save_dir, force_overwrite, cleanup)
+    else:
+        download_from_remote(remote, save_dir, force_overwrite)
+
+
 class DownloadProgressBar(tqdm):
-    """Wrap tqdm to show download progress"""
+    """Wrap tqdm to show download progress
 
-    def update_to(self, b=1, bsize=1, tsize=None):
-        if tsize is not None:
-            self.total = tsize
-        self.update(b * bsize - self.n)
+    Bars of concurrent downloads are drawn on separate lines.
+    """
+
+    _positions: Set[int] = set()
+    _positions_lock = threading.Lock()
+
+    def __init__(self, *args, **kwargs):
+        with DownloadProgressBar._positions_lock:
+            position = 0
+            while position in DownloadProgressBar._positions:
+                position += 1
+            DownloadProgressBar._positions.add(position)
+        self._download_position = position
+        super().__init__(*args, position=position, leave=position == 0, **kwargs)
+
+    def close(self):
+        super().close()
+        with DownloadProgressBar._positions_lock:
+            if self._download_position is not None:
+                DownloadProgressBar._positions.discard(self._download_position)
+                self._download_position = None
 
 
 def download_multipart_zip(zip_remotes, save_dir, force_overwrite, cleanup):
@@ -205,7 +264,8 @@ def download_multipart_zip(zip_remotes, save_dir, force_overwrite, cleanup):
         for l in range(len(zip_remotes)):
             zip_path = os.path.join(save_dir, zip_remotes[l].filename)
             os.remove(zip_path)
-    unzip(out_path, cleanup=cleanup)
+    with _EXTRACT_LOCK:
+        unzip(out_path, cleanup=cleanup)
 
 
 def download_from_remote(remote, save_dir, force_overwrite):
@@ -213,7 +273,7 @@ def download_from_remote(remote, save_dir, force_overwrite):
 
     Fetch a dataset pointed by remote's url, save into path using remote's
     filename and ensure its integrity based on the MD5 Checksum of the
-    downloaded file.
+    downloaded file. Interrupted downloads are resumed when run again.
 
     Adapted from scikit-learn's sklearn.datasets.base._fetch_remote.
 
@@ -234,8 +294,8 @@ def download_from_remote(remote, save_dir, force_overwrite):
     else:
         download_dir = os.path.join(save_dir, remote.destination_dir)
 
-    if not os.path.exists(download_dir):
-        os.makedirs(download_dir)
+    # remotes are downloaded concurrently and may share destination_dir
+    os.makedirs(download_dir, exist_ok=True)
 
     download_path = os.path.join(download_dir, remote.filename)
 
@@ -243,18 +303,19 @@ def download_from_remote(remote, save_dir, force_overwrite):
         # if we got here, we want to overwrite any existing file
         if os.path.exists(download_path):
             os.remove(download_path)
+        if force_overwrite and os.path.exists(download_path + ".part"):
+            os.remove(download_path + ".part")
 
         # If file doesn't exist or we want to overwrite, download it
         with DownloadProgressBar(
-            unit="B", unit_scale=True, unit_divisor=1024, miniters=1
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024,
+            miniters=1,
+            desc=remote.filename,
         ) as t:
             try:
-                urllib.request.urlretrieve(
-                    remote.url,
-                    filename=download_path,
-                    reporthook=t.update_to,
-                    data=None,
-                )
+                checksum = _fetch_and_hash(remote.url, download_path, t)
             except Exception as exc:
                 error_msg = """
                             soundata failed to download the dataset from {}!
@@ -272,8 +333,8 @@ def download_from_remote(remote, save_dir, force_overwrite):
             "{} already exists and will not be downloaded. ".format(download_path)
             + "Rerun with force_overwrite=True to delete this file and force the download."
         )
+        checksum = md5(download_path)
 
-    checksum = md5(download_path)
     if remote.checksum != checksum:
         raise IOError(
             "{} has an MD5 checksum ({}) "
@@ -283,6 +344,80 @@ def download_from_remote(remote, save_dir, force_overwrite):
     return download_path
 
 
+def _fetch_and_hash(url, download_path, progress_bar):
+    """Download a url to a file, computing the file's MD5 checksum as it
+    is written instead of reading it back afterwards.
+
+    The data is written to ``download_path + ".part"``, which is renamed to
+    download_path once complete. If a partial file is left over from an
+    interrupted download, the download resumes where it stopped, provided
+    the server supports range requests; otherwise it starts over.
+
+    Args:
+        url (str): the url to download
+        download_path (str): path to write the downloaded data to
+        progress_bar (tqdm): progress bar updated with the bytes written
+
+    Raises:
+        urllib.error.ContentTooShortError: if the download stops before the
+            size announced by the server
+
+    Returns:
+        str: md5 hash of the downloaded file
+
+    """
+    part_path = download_path + ".part"
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+
+    request = urllib.request.Request(url)
+    if offset:
+        request.add_header("Range", "bytes={}-".format(offset))
+    try:
+        response = urllib.request.urlopen(request)
+    except urllib.error.HTTPError as exc:
+        if not offset or exc.code != 416:
+            raise
+        # the partial file is not a prefix of the remote file
+        os.remove(part_path)
+        return _fetch_and_hash(url, download_path, progress_bar)
+
+    hash_md5 = hashlib.md5()
+    with response:
+        if offset and response.status == 206:
+            with open(part_path, "rb") as fhandle:
+                for chunk in iter(lambda: fhandle.read(1 << 20), b""):
+                    hash_md5.update(chunk)
+            mode = "ab"
+        else:
+            offset = 0
+            mode = "wb"
+
+        content_length = response.headers.get("Content-Length")
+        expected_size = None
+        if content_length is not None:
+            expected_size = offset + int(content_length)
+            progress_bar.total = expected_size
+        progress_bar.update(offset)
+
+        size = offset
+        with open(part_path, mode) as fhandle:
+            for chunk in iter(lambda: response.read(1 << 20), b""):
+                fhandle.write(chunk)
+                hash_md5.update(chunk)
+                size += len(chunk)
+                progress_bar.update(len(chunk))
+
+    if expected_size is not None and size < expected_size:
+        raise urllib.error.ContentTooShortError(
+            "retrieval incomplete: got only {} out of {} bytes".format(
+                size, expected_size
+            ),
+            None,
+        )
+    os.replace(part_path, download_path)
+    return hash_md5.hexdigest()
+
+
 def download_zip_file(zip_remote, save_dir, force_overwrite, cleanup):
     """Download and unzip a zip file.
 
@@ -298,7 +433,8 @@ def download_zip_file(zip_remote, save_dir, force_overwrite, cleanup):
 
     """
     zip_download_path = download_from_remote(zip_remote, save_dir, force_overwrite)
-    unzip(zip_download_path, cleanup=cleanup)
+    with _EXTRACT_LOCK:
+        unzip(zip_download_path, cleanup=cleanup)
 
 
 def extractall_unicode(zfile, out_dir):
@@ -356,7 +492,8 @@ def download_7z_file(tar_remote, save_dir, force_overwrite, cleanup):
 
     """
     _7z_download_path = download_from_remote(tar_remote, save_dir, force_overwrite)
-    un7z(_7z_download_path, cleanup=cleanup)
+    with _EXTRACT_LOCK:
+        un7z(_7z_download_path, cleanup=cleanup)
 
 
 def un7z(sevenz_path, cleanup):
@@ -384,7 +521,8 @@ def download_tar_file(tar_remote, save_dir, force_overwrite, cleanup):
 
     """
     tar_download_path = download_from_remote(tar_remote, save_dir, force_overwrite)
-    untar(tar_download_path, cleanup=cleanup)
+    with _EXTRACT_LOCK:
+        untar(tar_download_path, cleanup=cleanup)
 
 
 def untar(tar_path, cleanup):
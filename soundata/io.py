@@ -1,22 +1,30 @@
 import functools
 import io
-from typing import BinaryIO, Callable, Optional, TextIO, TypeVar, Union
+import os
+from typing import Any, BinaryIO, Callable, Optional, TextIO, Tuple, TypeVar, Union
+
+import librosa
+import numpy as np
 
 T = TypeVar("T")  # Can be anything
 
+AUDIO_DTYPES = ["float64", "float32", "float16", "int32", "int16"]
+
 
-def coerce_to_string_io(
-    func: Callable[[TextIO], T]
-) -> Callable[[Optional[Union[str, TextIO]]], Optional[T]]:
+def coerce_to_string_io(func: Callable[..., T]) -> Callable[..., Optional[T]]:
     @functools.wraps(func)
-    def wrapper(file_path_or_obj: Optional[Union[str, TextIO]]) -> Optional[T]:
+    def wrapper(
+        file_path_or_obj: Optional[Union[str, os.PathLike, TextIO]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Optional[T]:
         if not file_path_or_obj:
             return None
-        if isinstance(file_path_or_obj, str):
+        if isinstance(file_path_or_obj, (str, os.PathLike)):
             with open(file_path_or_obj) as f:
-                return func(f)
+                return func(f, *args, **kwargs)
         elif isinstance(file_path_or_obj, io.StringIO):
-            return func(file_path_or_obj)
+            return func(file_path_or_obj, *args, **kwargs)
         else:
             raise ValueError(
                 "Invalid argument passed to {}, argument has the type {}",
@@ -27,18 +35,20 @@ def coerce_to_string_io(
     return wrapper
 
 
-def coerce_to_bytes_io(
-    func: Callable[[BinaryIO], T]
-) -> Callable[[Optional[Union[str, BinaryIO]]], Optional[T]]:
+def coerce_to_bytes_io(func: Callable[..., T]) -> Callable[..., Optional[T]]:
     @functools.wraps(func)
-    def wrapper(file_path_or_obj: Optional[Union[str, BinaryIO]]) -> Optional[T]:
+    def wrapper(
+        file_path_or_obj: Optional[Union[str, os.PathLike, BinaryIO]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Optional[T]:
         if not file_path_or_obj:
             return None
-        if isinstance(file_path_or_obj, str):
+        if isinstance(file_path_or_obj, (str, os.PathLike)):
             with open(file_path_or_obj, "rb") as f:
-                return func(f)
+                return func(f, *args, **kwargs)
         elif isinstance(file_path_or_obj, io.BytesIO):
-            return func(file_path_or_obj)
+            return func(file_path_or_obj, *args, **kwargs)
         else:
             raise ValueError(
                 "Invalid argument passed to {}, argument has the type {}",
@@ -47,3 +57,117 @@ def coerce_to_bytes_io(
             )
 
     return wrapper
+
+
+def coerce_to_path_or_bytes_io(func: Callable[..., T]) -> Callable[..., Optional[T]]:
+    """Like coerce_to_bytes_io, but passes file paths on as strings instead of
+    opening them, for readers such as soundfile that access files on disk
+    faster by themselves than through a Python file object. Where supported,
+    the kernel is asked to start reading the file ahead before func runs.
+    """
+
+    @functools.wraps(func)
+    def wrapper(
+        file_path_or_obj: Optional[Union[str, os.PathLike, BinaryIO]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Optional[T]:
+        if not file_path_or_obj:
+            return None
+        if isinstance(file_path_or_obj, (str, os.PathLike)):
+            file_path = os.fspath(file_path_or_obj)
+            _advise_willneed(file_path)
+            return func(file_path, *args, **kwargs)
+        elif isinstance(file_path_or_obj, io.BytesIO):
+            return func(file_path_or_obj, *args, **kwargs)
+        else:
+            raise ValueError(
+                "Invalid argument passed to {}, argument has the type {}",
+                func.__name__,
+                type(file_path_or_obj),
+            )
+
+    return wrapper
+
+
+def _advise_willneed(file_path: str) -> None:
+    # Raises FileNotFoundError for missing files. On platforms with
+    # posix_fadvise this also starts kernel readahead of the whole file, so
+    # the read overlaps with the decoder's setup.
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+
+
+def audio_read_dtype(dtype: str) -> str:
+    """Validate the dtype requested from an audio loader
+
+    Args:
+        dtype (str): one of AUDIO_DTYPES. Integer types return the raw PCM
+            values of the file.
+
+    Raises:
+        ValueError: if dtype is not one of AUDIO_DTYPES
+
+    Returns:
+        str: the dtype to decode the audio with. soundfile cannot decode to
+        float16, so float16 audio is decoded as float32 and converted after.
+
+    """
+    if dtype not in AUDIO_DTYPES:
+        raise ValueError(
+            "Invalid dtype {}. Must be one of {}.".format(dtype, AUDIO_DTYPES)
+        )
+    return "float32" if dtype == "float16" else dtype
+
+
+def downmix(audio: np.ndarray, dtype: str) -> np.ndarray:
+    """Average the channels of decoded audio
+
+    Args:
+        audio (np.ndarray): samples with shape (n_samples,) or
+            (n_samples, n_channels)
+        dtype (str): the requested dtype. Integer samples are averaged in
+            floating point and rounded back to dtype.
+
+    Returns:
+        np.ndarray: the mono audio signal
+
+    """
+    if audio.ndim == 2:
+        if dtype.startswith("int"):
+            audio = np.round(audio.mean(axis=1)).astype(dtype)
+        else:
+            audio = audio.mean(axis=1)
+    return audio
+
+
+def resample_audio(
+    audio: np.ndarray, file_sr: float, sr: Optional[float], dtype: str, axis: int = -1
+) -> Tuple[np.ndarray, float]:
+    """Resample decoded audio if the requested sample rate differs from the
+    file's
+
+    Args:
+        audio (np.ndarray): the decoded audio
+        file_sr (float): the sample rate of the file
+        sr (float or None): the requested sample rate, None for the file's
+        dtype (str): the requested dtype
+        axis (int): the time axis of audio
+
+    Raises:
+        ValueError: if the audio needs resampling and dtype is an integer type
+
+    Returns:
+        * np.ndarray - the audio at the requested sample rate
+        * float - the sample rate of the returned audio
+
+    """
+    if sr is None or sr == file_sr:
+        return audio, file_sr
+    if dtype.startswith("int"):
+        raise ValueError("Integer dtypes can only be loaded at the file's sample rate")
+    return librosa.resample(audio, orig_sr=file_sr, target_sr=sr, axis=axis), sr
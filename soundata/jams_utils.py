@@ -3,13 +3,15 @@
 
 import logging
 import os
-from typing import Callable, List
+from typing import TYPE_CHECKING, Callable, List
 
-import jams
 import librosa
 
 from soundata import annotations
 
+if TYPE_CHECKING:
+    import jams
+
 
 def jams_converter(
     audio_path=None, spectrogram_path=None, metadata=None, tags=None, events=None
@@ -32,6 +34,7 @@ def jams_converter(
         jams.JAMS: A JAMS object containing the annotations.
 
     """
+    import jams
 
     jam = jams.JAMS()
 
@@ -107,7 +110,7 @@ def multiannotator_to_jams(
     multiannot: annotations.MultiAnnotator,
     converter: Callable[..., annotations.Annotation],
     **kwargs,
-) -> List[jams.Annotation]:
+) -> List["jams.Annotation"]:
     """Convert tags annotations into jams format.
 
     Args:
@@ -140,6 +143,8 @@ def tags_to_jams(
         jams.Annotation: jams annotation object.
 
     """
+    import jams
+
     ann = jams.Annotation(namespace=namespace)
     ann.annotation_metadata = jams.AnnotationMetadata(
         data_source="soundata",
@@ -164,6 +169,7 @@ def events_to_jams(events, annotator=None, description=None):
         jams.Annotation: jams annotation object.
 
     """
+    import jams
 
     jannot_events = jams.Annotation(namespace="segment_open")
     jannot_events.annotation_metadata = jams.AnnotationMetadata(
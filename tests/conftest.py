@@ -1,5 +1,10 @@
-import pytest
+import glob
 import os
+import shutil
+
+import pytest
+
+from soundata import core
 
 
 def pytest_addoption(parser):
@@ -53,6 +58,17 @@ def report_file(request):
     return request.config.getoption("--report-file")
 
 
+@pytest.fixture(scope="session", autouse=True)
+def clean_metadata_caches():
+    # loaders cache their metadata next to the test data; remove it afterwards
+    yield
+    resources_dir = os.path.join(os.path.dirname(__file__), "resources")
+    for cache_dir in glob.glob(
+        os.path.join(resources_dir, "**", core.METADATA_CACHE_DIR), recursive=True
+    ):
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
 def pytest_sessionstart(session):
     session.results = dict()
 
@@ -47,6 +47,12 @@ def test_load_audio():
     assert audio.shape[0] == 32  # check audio is 32ch (HOA 4th order)
     assert audio.shape[1] == 48000 * 1.0  # Check audio duration is as expected
 
+    # partial loading
+    segment, sr = eigenscape_raw.load_audio(audio_path, offset=0.25, duration=0.5)
+    assert sr == 48000
+    assert segment.shape == (32, 24000)
+    assert np.array_equal(segment, audio[:, 12000:36000])
+
 
 def test_load_tags():
     # dataset
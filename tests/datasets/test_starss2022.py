@@ -49,6 +49,12 @@ def test_load_audio():
     assert audio.shape[0] == 4  # check audio is loaded as 4 channels
     assert audio.shape[1] == 24000  # check audio duration in samples is as expected
 
+    # partial loading
+    segment, sr = starss2022.load_audio(audio_path, offset=0.25, duration=0.5)
+    assert sr == 24000
+    assert segment.shape == (4, 12000)
+    assert np.array_equal(segment, audio[:, 6000:18000])
+
 
 def test_load_SpatialEvents():
     dataset = starss2022.Dataset(TEST_DATA_HOME, version="test")
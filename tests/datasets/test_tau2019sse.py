@@ -49,6 +49,12 @@ def test_load_audio():
     assert audio.shape[0] == 4  # Check audio is 4 chanels
     assert audio.shape[1] == 48000  # Check audio duration in samples is as expected
 
+    # partial loading
+    segment, sr = tau2019sse.load_audio(audio_path, offset=0.25, duration=0.5)
+    assert sr == 48000
+    assert segment.shape == (4, 24000)
+    assert np.array_equal(segment, audio[:, 12000:36000])
+
 
 def test_to_jams():
     # Note: original file  tsrimmed to 1 sec
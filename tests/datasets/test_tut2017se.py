@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from tests.test_utils import run_clip_tests
 
@@ -55,6 +56,39 @@ def test_load_audio():
     assert type(audio) is np.ndarray
     assert len(audio.shape) == 2  # check audio is loaded as stereo
     assert audio.shape[1] == 44100  # Check audio duration is as expected
+    assert audio.dtype == np.float32
+
+    audio_int, sr = tut2017se.load_audio(audio_path, dtype="int16")
+    assert sr == 44100
+    assert audio_int.dtype == np.int16
+    assert audio_int.shape == audio.shape
+    assert np.allclose(audio_int / 32768.0, audio)
+
+    audio_half, sr = tut2017se.load_audio(audio_path, dtype="float16")
+    assert audio_half.dtype == np.float16
+    assert audio_half.shape == audio.shape
+
+    audio_rs, sr = tut2017se.load_audio(audio_path, sr=22050)
+    assert sr == 22050
+    assert audio_rs.shape == (2, 22050)
+
+    audio_cl, sr = tut2017se.load_audio(audio_path, channel_first=False)
+    assert audio_cl.shape == (44100, 2)
+    assert audio_cl.flags["C_CONTIGUOUS"]
+    assert np.array_equal(audio_cl.T, audio)
+
+    audio_slice, sr = tut2017se.load_audio(audio_path, offset=0.25, duration=0.5)
+    assert sr == 44100
+    assert audio_slice.shape == (2, 22050)
+    assert np.array_equal(audio_slice, audio[:, 11025:33075])
+
+    audio_tail, sr = tut2017se.load_audio(audio_path, offset=0.5)
+    assert np.array_equal(audio_tail, audio[:, 22050:])
+
+    with pytest.raises(ValueError):
+        tut2017se.load_audio(audio_path, dtype="uint8")
+    with pytest.raises(ValueError):
+        tut2017se.load_audio(audio_path, sr=22050, dtype="int16")
 
 
 def test_load_events():
@@ -73,6 +107,19 @@ def test_load_events():
         assert labels[j] == annotations.labels[j]
 
 
+def test_load_all_events():
+    dataset = tut2017se.Dataset(TEST_DATA_HOME, version="test")
+    all_events = dataset.load_all_events()
+    assert list(all_events.keys()) == dataset.clip_ids
+
+    events = dataset.load_all_events(["a001"])["a001"]
+    expected = tut2017se.load_events(dataset.clip("a001").annotations_path)
+    assert np.allclose(events.intervals, expected.intervals)
+    assert events.labels == expected.labels
+
+    assert dataset.load_all_events([]) == {}
+
+
 def test_to_jams():
     default_clipid = "a001"
     dataset = tut2017se.Dataset(TEST_DATA_HOME, version="test")
@@ -1,5 +1,7 @@
+import io
 import os
 import numpy as np
+import pytest
 
 from tests.test_utils import run_clip_tests
 
@@ -40,6 +42,33 @@ def test_clip():
     run_clip_tests(clip, expected_attributes, expected_property_types)
 
 
+def test_filter_by_split():
+    dataset = urbansed.Dataset(TEST_DATA_HOME, version="test")
+    assert dataset.filter_by_split("train") == ["soundscape_train_uniform1736"]
+    assert dataset.filter_by_split("validate") == []
+    assert dataset.filter_by_split("test") == []
+
+    with pytest.raises(ValueError):
+        dataset.filter_by_split("development")
+
+
+def test_filter_by_split_order(tmp_path):
+    clip_ids = {
+        "train": ["soundscape_train_uniform{}".format(i) for i in [7, 5, 2, 10, 1]],
+        "test": ["soundscape_test_bimodal{}".format(i) for i in [3, 30, 12]],
+    }
+    for split, split_clip_ids in clip_ids.items():
+        annotation_folder = tmp_path / "annotations" / split
+        annotation_folder.mkdir(parents=True)
+        for clip_id in split_clip_ids:
+            (annotation_folder / "{}.txt".format(clip_id)).write_text("")
+
+    dataset = urbansed.Dataset(str(tmp_path), version="test")
+    assert dataset.filter_by_split("train") == sorted(clip_ids["train"])
+    assert dataset.filter_by_split("test") == sorted(clip_ids["test"])
+    assert dataset.filter_by_split("validate") == []
+
+
 def test_load_audio():
     dataset = urbansed.Dataset(TEST_DATA_HOME, version="test")
     clip = dataset.clip("soundscape_train_uniform1736")
@@ -50,6 +79,111 @@ def test_load_audio():
     assert len(audio.shape) == 1  # check audio is loaded as mono
     assert audio.shape[0] == 44100  # Check audio duration in samples is as expected
 
+    audio, sr = urbansed.load_audio(audio_path, sr=22050)
+    assert sr == 22050
+    assert audio.shape == (22050,)
+
+
+def test_load_audio_dtype():
+    dataset = urbansed.Dataset(TEST_DATA_HOME, version="test")
+    audio_path = dataset.clip("soundscape_train_uniform1736").audio_path
+    audio, sr = urbansed.load_audio(audio_path, sr=None)
+
+    audio_int16, sr_int16 = urbansed.load_audio(audio_path, sr=None, dtype="int16")
+    assert sr_int16 == sr
+    assert audio_int16.dtype == np.int16
+    assert audio_int16.shape == audio.shape
+    assert np.allclose(audio_int16 / 32768.0, audio, atol=1.0 / 32768)
+
+    audio_float16, _ = urbansed.load_audio(audio_path, sr=None, dtype="float16")
+    assert audio_float16.dtype == np.float16
+    assert np.allclose(audio_float16, audio, atol=1e-3)
+
+    audio_float16, _ = urbansed.load_audio(audio_path, sr=22050, dtype="float16")
+    assert audio_float16.dtype == np.float16
+    assert audio_float16.shape == (22050,)
+
+    with pytest.raises(ValueError):
+        urbansed.load_audio(audio_path, sr=22050, dtype="int16")
+    with pytest.raises(ValueError):
+        urbansed.load_audio(audio_path, dtype="uint8")
+
+
+def test_load_audio_stream():
+    dataset = urbansed.Dataset(TEST_DATA_HOME, version="test")
+    audio_path = dataset.clip("soundscape_train_uniform1736").audio_path
+    audio, sr = urbansed.load_audio(audio_path)
+
+    blocks, stream_sr = urbansed.load_audio(audio_path, stream=True, block_seconds=0.3)
+    blocks = list(blocks)
+    assert stream_sr == sr
+    assert [len(block) for block in blocks] == [13230, 13230, 13230, 4410]
+    assert np.array_equal(np.concatenate(blocks), audio)
+
+    with open(audio_path, "rb") as fhandle:
+        audio_bytes = io.BytesIO(fhandle.read())
+    blocks, _ = urbansed.load_audio(audio_bytes, stream=True)
+    assert np.array_equal(np.concatenate(list(blocks)), audio)
+
+    with pytest.raises(ValueError):
+        urbansed.load_audio(audio_path, sr=22050, stream=True)
+
+
+def test_iter_audio():
+    dataset = urbansed.Dataset(TEST_DATA_HOME, version="test")
+    clip_id = "soundscape_train_uniform1736"
+    expected_audio, expected_sr = dataset.clip(clip_id).audio
+
+    loaded = list(dataset.iter_audio([clip_id] * 3, num_workers=2))
+    assert [cid for cid, _ in loaded] == [clip_id] * 3
+    for _, (audio, sr) in loaded:
+        assert sr == expected_sr
+        assert np.array_equal(audio, expected_audio)
+
+    assert list(dataset.iter_audio([])) == []
+
+
+def test_load_events():
+    dataset = urbansed.Dataset(TEST_DATA_HOME, version="test")
+    clip = dataset.clip("soundscape_train_uniform1736")
+    events = urbansed.load_events(clip.txt_path)
+
+    assert len(events.labels) == 6
+    assert events.labels[0] == "gun_shot"
+    assert np.allclose(events.intervals[0], [1.265813, 1.675981])
+    assert np.allclose(events.confidence, [1.0] * 6)
+
+    # parsed files are cached per path
+    assert urbansed.load_events(clip.txt_path) is events
+
+    with open(clip.txt_path) as fhandle:
+        events_fhandle = urbansed.load_events(io.StringIO(fhandle.read()))
+    assert events_fhandle is not events
+    assert np.allclose(events_fhandle.intervals, events.intervals)
+    assert events_fhandle.labels == events.labels
+
+    assert urbansed.load_events(None) is None
+    with pytest.raises(IOError):
+        urbansed.load_events("a/fake/filepath")
+
+
+def test_load_all_events():
+    dataset = urbansed.Dataset(TEST_DATA_HOME, version="test")
+    clip_id = "soundscape_train_uniform1736"
+    all_events = dataset.load_all_events()
+    assert list(all_events.keys()) == [clip_id]
+    assert all_events[clip_id].labels == dataset.clip(clip_id).events.labels
+    assert np.array_equal(
+        all_events[clip_id].intervals, dataset.clip(clip_id).events.intervals
+    )
+
+    assert dataset.load_all_events([]) == {}
+
+
+def test_metadata():
+    dataset = urbansed.Dataset(TEST_DATA_HOME, version="test")
+    assert dataset._metadata == {"soundscape_train_uniform1736": {"split": "train"}}
+
 
 def test_to_jams():
     # Note: original file is 4 sec, but for testing we've trimmed it to 1 sec
@@ -209,3 +343,9 @@ def test_to_jams():
             assert scaper_sandbox[key] == reg_scaper_sandbox[key]
 
     assert jam.annotations[0].annotation_metadata.data_source == "soundata"
+
+    # repeated calls return independent copies of the cached jams
+    jam.file_metadata.duration = 5.0
+    jam_again = clip.to_jams()
+    assert jam_again is not jam
+    assert jam_again.file_metadata.duration == 10.0
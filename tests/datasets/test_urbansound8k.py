@@ -1,5 +1,9 @@
 import os
+import pickle
+import struct
 import numpy as np
+import pytest
+import soundfile as sf
 
 from tests.test_utils import run_clip_tests
 
@@ -39,6 +43,53 @@ def test_clip():
 
     run_clip_tests(clip, expected_attributes, expected_property_types)
 
+    # decoded audio is cached, but each access returns its own copy
+    audio, sr = clip.audio
+    audio[:] = 0
+    cached_audio, cached_sr = clip.audio
+    assert cached_sr == sr
+    assert cached_audio is not audio
+    assert np.any(cached_audio != 0)
+
+    # tags are shared between clips of the same class
+    assert clip.tags is dataset.clip("135776-2-0-49").tags
+    assert clip.tags.labels == ["children_playing"]
+    assert np.array_equal(clip.tags.confidence, [1.0])
+
+
+def test_clip_metadata():
+    dataset = urbansound8k.Dataset(TEST_DATA_HOME, version="test")
+    metadata = dataset._metadata["135776-2-0-49"]
+
+    assert isinstance(metadata, urbansound8k.ClipMetadata)
+    assert metadata.fold == 1
+    assert metadata["class_label"] == "children_playing"
+    assert metadata.get("salience") == 2
+    assert metadata.get("duration") is None
+    assert "fold" in metadata and "count" not in metadata
+    assert list(metadata) == list(metadata.keys())
+    assert len(metadata) == 8
+    assert dict(metadata) == {
+        "slice_file_name": "135776-2-0-49.wav",
+        "freesound_id": "135776",
+        "freesound_start_time": 24.5,
+        "freesound_end_time": 28.5,
+        "salience": 2,
+        "fold": 1,
+        "class_id": 2,
+        "class_label": "children_playing",
+    }
+    for key in ["duration", "count", "index", "__class__"]:
+        with pytest.raises(KeyError):
+            metadata[key]
+        assert metadata.get(key) is None
+    assert pickle.loads(pickle.dumps(metadata)) == metadata
+    assert not hasattr(metadata, "__dict__")
+
+    # class labels are shared between clips
+    labels = [clip_metadata.class_label for clip_metadata in dataset._metadata.values()]
+    assert len({id(label) for label in labels}) == len(set(labels))
+
 
 def test_load_audio():
     dataset = urbansound8k.Dataset(TEST_DATA_HOME, version="test")
@@ -50,6 +101,107 @@ def test_load_audio():
     assert len(audio.shape) == 1  # check audio is loaded as mono
     assert audio.shape[0] == 44100  # Check audio duration in sampels is as expected
 
+    audio, sr = urbansound8k.load_audio(audio_path, sr=22050)
+    assert sr == 22050
+    assert audio.shape == (22050,)
+
+
+def test_event_labels():
+    dataset = urbansound8k.Dataset(TEST_DATA_HOME, version="test")
+    assert dataset._event_labels() == [
+        dataset.clip(clip_id).class_label for clip_id in dataset.clip_ids
+    ]
+
+
+def test_iter_audio():
+    dataset = urbansound8k.Dataset(TEST_DATA_HOME, version="test")
+    clip_id = "135776-2-0-49"
+    expected_audio, expected_sr = dataset.clip(clip_id).audio
+
+    loaded = list(dataset.iter_audio([clip_id] * 3, num_workers=2))
+    assert [cid for cid, _ in loaded] == [clip_id] * 3
+    for _, (audio, sr) in loaded:
+        assert sr == expected_sr
+        assert np.array_equal(audio, expected_audio)
+
+    assert list(dataset.iter_audio([])) == []
+
+
+def test_load_audio_dtype():
+    dataset = urbansound8k.Dataset(TEST_DATA_HOME, version="test")
+    audio_path = dataset.clip("135776-2-0-49").audio_path
+    audio, sr = urbansound8k.load_audio(audio_path, sr=None)
+
+    audio_int16, sr_int16 = urbansound8k.load_audio(audio_path, sr=None, dtype="int16")
+    assert sr_int16 == sr
+    assert audio_int16.dtype == np.int16
+    assert audio_int16.shape == audio.shape
+    assert np.allclose(audio_int16 / 32768.0, audio, atol=1.0 / 32768)
+
+    audio_float16, _ = urbansound8k.load_audio(audio_path, sr=None, dtype="float16")
+    assert audio_float16.dtype == np.float16
+    assert np.allclose(audio_float16, audio, atol=1e-3)
+
+    audio_float16, _ = urbansound8k.load_audio(audio_path, sr=22050, dtype="float16")
+    assert audio_float16.dtype == np.float16
+    assert audio_float16.shape == (22050,)
+
+    with pytest.raises(ValueError):
+        urbansound8k.load_audio(audio_path, sr=22050, dtype="int16")
+    with pytest.raises(ValueError):
+        urbansound8k.load_audio(audio_path, dtype="uint8")
+
+
+def test_load_audio_fast(tmp_path):
+    dataset = urbansound8k.Dataset(TEST_DATA_HOME, version="test")
+    audio_path = dataset.clip("135776-2-0-49").audio_path
+
+    # 16-bit PCM at its native sample rate is memory-mapped
+    audio, sr = urbansound8k.load_audio(audio_path, sr=None)
+    audio_fast, sr_fast = urbansound8k.load_audio(audio_path, sr=None, fast=True)
+    assert sr_fast == sr == 48000
+    assert audio_fast.dtype == np.float32
+    assert np.array_equal(audio_fast, audio)
+
+    audio_fast, _ = urbansound8k.load_audio(
+        audio_path, sr=None, fast=True, dtype="int16"
+    )
+    audio_int16, _ = urbansound8k.load_audio(audio_path, sr=None, dtype="int16")
+    assert audio_fast.dtype == np.int16
+    assert np.array_equal(audio_fast, audio_int16)
+
+    # resampling falls back to the decoder
+    audio, sr = urbansound8k.load_audio(audio_path)
+    audio_fast, sr_fast = urbansound8k.load_audio(audio_path, fast=True)
+    assert sr_fast == sr == 44100
+    assert np.array_equal(audio_fast, audio)
+
+    # other sample formats fall back to the decoder
+    pcm24_path = str(tmp_path / "pcm24.wav")
+    sf.write(pcm24_path, np.zeros((100, 2)), 44100, subtype="PCM_24")
+    assert urbansound8k._map_pcm16_wav(pcm24_path) is None
+    audio_fast, sr_fast = urbansound8k.load_audio(pcm24_path, fast=True)
+    assert audio_fast.shape == (100,)
+
+    # malformed headers fall back to the decoder instead of raising
+    zero_align_path = str(tmp_path / "zero_align.wav")
+    with open(zero_align_path, "wb") as fhandle:
+        fhandle.write(struct.pack("<4sI4s", b"RIFF", 44, b"WAVE"))
+        fhandle.write(struct.pack("<4sIHHIIHH", b"fmt ", 16, 1, 1, 44100, 0, 0, 16))
+        fhandle.write(struct.pack("<4sI", b"data", 8) + bytes(8))
+    assert urbansound8k._map_pcm16_wav(zero_align_path) is None
+    audio_fast, sr_fast = urbansound8k.load_audio(zero_align_path, sr=None, fast=True)
+    audio, sr = urbansound8k.load_audio(zero_align_path, sr=None)
+    assert sr_fast == sr
+    assert np.array_equal(audio_fast, audio)
+
+    truncated_path = str(tmp_path / "truncated.wav")
+    with open(truncated_path, "wb") as fhandle:
+        fhandle.write(b"RIFF")
+    assert urbansound8k._map_pcm16_wav(truncated_path) is None
+    with pytest.raises(sf.SoundFileError):
+        urbansound8k.load_audio(truncated_path, fast=True)
+
 
 def test_to_jams():
     # Note: original file is 4 sec, but for testing we've trimmed it to 1 sec
@@ -5,6 +5,7 @@ import numpy as np
 
 import soundata
 from soundata import core
+from soundata import download_utils
 from tests.test_utils import DEFAULT_DATA_HOME
 from unittest.mock import Mock, patch
 
@@ -188,6 +189,133 @@ def test_dataset():
 
     print(dataset)  # test that repr doesn't fail
 
+    # clips are built on each lookup, so they follow changes to data_home
+    data_home = os.path.normpath("tests/resources/sound_datasets/urbansound8k")
+    dataset = soundata.initialize("urbansound8k", data_home, version="test")
+    clip = dataset.clip("135776-2-0-49")
+    assert clip is not dataset.clip("135776-2-0-49")
+    dataset.data_home = os.path.normpath("elsewhere")
+    assert dataset.clip("135776-2-0-49").audio_path.startswith("elsewhere")
+    assert clip.audio_path.startswith(data_home)
+    with pytest.raises(ValueError):
+        dataset.clip("not_a_clip")
+
+
+def test_iter_audio():
+    data_home = os.path.normpath("tests/resources/sound_datasets/urbansound8k")
+    dataset = soundata.initialize("urbansound8k", data_home, version="test")
+    clip_id = "135776-2-0-49"
+    expected_audio, expected_sr = dataset.clip(clip_id).audio
+
+    loaded = list(dataset.iter_audio([clip_id] * 5, prefetch=2))
+    assert [cid for cid, _ in loaded] == [clip_id] * 5
+    for _, (audio, sr) in loaded:
+        assert sr == expected_sr
+        assert np.array_equal(audio, expected_audio)
+
+    loaded = list(dataset.iter_audio([clip_id] * 5, prefetch=4, num_workers=1))
+    assert [cid for cid, _ in loaded] == [clip_id] * 5
+
+    assert [cid for cid, _ in dataset.iter_audio()] == dataset.clip_ids
+    assert list(dataset.iter_audio([])) == []
+
+    with pytest.raises(ValueError):
+        list(dataset.iter_audio(prefetch=0))
+
+
+def test_dataset_download(httpserver, tmp_path, mocker):
+    httpserver.serve_content(open("tests/resources/remote.wav", "rb").read())
+    dataset = soundata.initialize("esc50", str(tmp_path), version="sample")
+    dataset.remotes = {
+        str(i): download_utils.RemoteFileMetadata(
+            filename="remote{}.wav".format(i),
+            url=httpserver.url,
+            checksum="3f77d0d69dc41b3696f074ad6bf2852f",
+        )
+        for i in range(4)
+    }
+    spy = mocker.spy(download_utils, "downloader")
+
+    dataset.download(max_workers=2)
+    assert spy.call_args.kwargs["max_workers"] == 2
+    assert sorted(os.listdir(tmp_path)) == ["remote{}.wav".format(i) for i in range(4)]
+
+    dataset.download(force_overwrite=True)
+    assert spy.call_args.kwargs["max_workers"] == 1
+
+
+def test_load_cached_metadata(tmp_path):
+    source_path = tmp_path / "metadata.csv"
+    source_path.write_text("a,b\n")
+    build_metadata = Mock(return_value={"clip": {"x": 1}})
+
+    metadata = core.load_cached_metadata(
+        str(tmp_path), [str(source_path)], build_metadata
+    )
+    assert metadata == {"clip": {"x": 1}}
+    assert build_metadata.call_count == 1
+    cache_files = os.listdir(tmp_path / core.METADATA_CACHE_DIR)
+    assert len(cache_files) == 1 and cache_files[0].endswith(".pkl")
+
+    # cache hit
+    metadata = core.load_cached_metadata(
+        str(tmp_path), [str(source_path)], build_metadata
+    )
+    assert metadata == {"clip": {"x": 1}}
+    assert build_metadata.call_count == 1
+
+    # changing the source invalidates the cache
+    source_path.write_text("a,b,c\n")
+    core.load_cached_metadata(str(tmp_path), [str(source_path)], build_metadata)
+    assert build_metadata.call_count == 2
+    # and the stale cache is removed
+    assert len(os.listdir(tmp_path / core.METADATA_CACHE_DIR)) == 1
+
+    # so does changing the metadata format version
+    core.load_cached_metadata(
+        str(tmp_path), [str(source_path)], build_metadata, version="2"
+    )
+    assert build_metadata.call_count == 3
+    assert len(os.listdir(tmp_path / core.METADATA_CACHE_DIR)) == 1
+
+    # caches of other sources are kept
+    other_path = tmp_path / "other.csv"
+    other_path.write_text("a\n")
+    core.load_cached_metadata(str(tmp_path), [str(other_path)], build_metadata)
+    assert len(os.listdir(tmp_path / core.METADATA_CACHE_DIR)) == 2
+    assert build_metadata.call_count == 4
+
+    # an unwritable cache location is not an error
+    unwritable_home = tmp_path / "unwritable"
+    unwritable_home.mkdir()
+    (unwritable_home / core.METADATA_CACHE_DIR).write_text("")
+    metadata = core.load_cached_metadata(
+        str(unwritable_home), [str(source_path)], build_metadata
+    )
+    assert metadata == {"clip": {"x": 1}}
+    assert build_metadata.call_count == 5
+
+    # nothing is written for missing sources or a missing data_home
+    missing_home = tmp_path / "missing"
+    core.load_cached_metadata(str(missing_home), [str(source_path)], build_metadata)
+    assert not missing_home.exists()
+    core.load_cached_metadata(
+        str(tmp_path), [str(tmp_path / "missing.csv")], build_metadata
+    )
+    assert len(os.listdir(tmp_path / core.METADATA_CACHE_DIR)) == 2
+    assert build_metadata.call_count == 7
+
+    # a cache that cannot be unpickled is rebuilt
+    for filename in os.listdir(tmp_path / core.METADATA_CACHE_DIR):
+        (tmp_path / core.METADATA_CACHE_DIR / filename).write_bytes(
+            b"\x80\x04csoundata.core\nNoSuchClass\n."
+        )
+    metadata = core.load_cached_metadata(
+        str(tmp_path), [str(source_path)], build_metadata
+    )
+    assert metadata == {"clip": {"x": 1}}
+    assert build_metadata.call_count == 8
+
 
 def test_list_versions():
     assert (
@@ -317,6 +445,13 @@ def test_dataset_errors():
     with pytest.raises(AttributeError):
         d.choice_clipgroup()
 
+    # esc50 has no event labels in its metadata
+    assert d._event_labels() is None
+
+    # esc50 has no events annotation files
+    with pytest.raises(AttributeError):
+        d.load_all_events()
+
     # uncomment this to test in dataset with clip_group
     # d = soundata.initialize("dataset_with_clip_group")
     # with pytest.raises(ValueError):
@@ -3,6 +3,7 @@ from unittest import mock
 from unittest.mock import MagicMock, Mock, patch
 import pytest
 import numpy as np
+import matplotlib.pyplot as plt
 from soundata import display_plot_utils
 import soundata
 import simpleaudio as sa
@@ -63,6 +64,30 @@ def test_compute_clip_statistics():
         display_plot_utils.compute_clip_statistics(empty_dataset)
 
 
+def test_clip_duration():
+    dataset = soundata.initialize(
+        "urbansound8k", "tests/resources/sound_datasets/urbansound8k", version="test"
+    )
+    # read from the file header
+    assert display_plot_utils.clip_duration(dataset, "135776-2-0-49") == 1.0
+
+    # clips without an audio path fall back to decoding the audio
+    mock_dataset = MockDataset([2])
+    assert display_plot_utils.clip_duration(mock_dataset, 0) == 2.0
+
+
+def test_waveform_envelope():
+    audio = np.sin(np.linspace(0, 100, 44100))
+    envelope = display_plot_utils.waveform_envelope(audio, n_bins=100)
+    assert envelope.shape == (200,)
+    assert np.array_equal(envelope[0::2], audio[:44100].reshape(100, 441).min(axis=1))
+    assert np.array_equal(envelope[1::2], audio[:44100].reshape(100, 441).max(axis=1))
+
+    # short signals are returned as is
+    short_audio = np.random.random(150)
+    assert display_plot_utils.waveform_envelope(short_audio, n_bins=100) is short_audio
+
+
 def test_perform_dataset_exploration_initialization():
     """Test the initialization and default states of widgets."""
     # Create a mock instance with specific return values for the widget attributes
@@ -91,6 +116,7 @@ def test_plot_hierarchical_distribution_no_subdatasets(
     mock_instance = MagicMock()
     mock_instance._metadata = {}
     mock_instance._index = {"clips": ["clip1", "clip2"]}
+    mock_instance._event_labels.return_value = None
 
     # Mock clips
     mock_clip = MagicMock()
@@ -108,9 +134,24 @@ def test_plot_hierarchical_distribution_no_subdatasets(
     mock_plt.show.assert_called()
 
 
+@patch("soundata.display_plot_utils.plot_distribution")
+@patch("soundata.display_plot_utils.plt", autospec=True)
+def test_plot_hierarchical_distribution_class_labels(mock_plt, mock_plot_distribution):
+    # Labels are read from the metadata, without building the clips
+    mock_instance = MagicMock()
+    mock_instance._metadata = {}
+    mock_instance._index = {"clips": ["clip1", "clip2"]}
+    mock_instance._event_labels.return_value = ["dog_bark", "siren"]
+
+    display_plot_utils.plot_hierarchical_distribution(mock_instance)
+
+    mock_instance.clip.assert_not_called()
+    assert mock_plot_distribution.call_args_list[0][0][0] == ["dog_bark", "siren"]
+
+
 def test_play_segment_true():
-    # Mock audio segment and other dependencies
-    audio_segment = mock.MagicMock()
+    # Mock audio samples and other dependencies
+    audio_playback = np.zeros(44100 * 90, dtype=np.int16)
     start_time = 0
     sr = 44100
     stop_event = mock.MagicMock()
@@ -127,15 +168,15 @@ def test_play_segment_true():
         mock_play_obj.is_playing.side_effect = [True, False]
 
         # Call the play_segment function
-        display_plot_utils.play_segment(audio_segment, start_time, stop_event, sr)
-
-        # Assert that the play_buffer function was called with the correct arguments
-        sa.play_buffer.assert_called_once_with(
-            audio_segment[start_time * 1000 : (start_time + 60) * 1000].raw_data,
-            1,
-            2,
-            sr,
-        )
+        display_plot_utils.play_segment(audio_playback, start_time, stop_event, sr)
+
+        # Assert that the play_buffer function was called with up to one minute of
+        # samples, passed without copying
+        sa.play_buffer.assert_called_once()
+        segment, n_channels, bytes_per_sample, play_sr = sa.play_buffer.call_args[0]
+        assert (n_channels, bytes_per_sample, play_sr) == (1, 2, sr)
+        assert len(segment) == 60 * sr
+        assert np.shares_memory(segment, audio_playback)
 
         # Assert that play_obj.stop() was called once
         mock_play_obj.stop.assert_called_once()
@@ -185,6 +226,7 @@ def test_plot_hierarchical_distribution(mock_plt, mock_plot_distribution):
         return None
 
     mock_instance.clip.side_effect = clip_side_effect
+    mock_instance._event_labels.return_value = None
 
     # Execute the method
     display_plot_utils.plot_hierarchical_distribution(mock_instance)
@@ -394,13 +436,13 @@ def test_play_segment(mock_sleep, mock_play_buffer):
     mock_play_obj.is_playing.side_effect = [True, True, False]
     mock_play_buffer.return_value = mock_play_obj
 
-    # Create dummy audio segment and stop event
-    audio_segment = MagicMock()
+    # Create dummy audio samples and stop event
+    audio_playback = np.zeros(44100, dtype=np.int16)
     stop_event = threading.Event()
 
     # Test normal playback
     display_plot_utils.play_segment(
-        audio_segment, start_time=0, stop_event=stop_event, sr=44100
+        audio_playback, start_time=0, stop_event=stop_event, sr=44100
     )
     mock_play_buffer.assert_called_once()
     assert not stop_event.is_set()
@@ -412,17 +454,17 @@ def test_play_segment(mock_sleep, mock_play_buffer):
     # Test stopping playback
     stop_event.set()
     display_plot_utils.play_segment(
-        audio_segment, start_time=0, stop_event=stop_event, sr=44100
+        audio_playback, start_time=0, stop_event=stop_event, sr=44100
     )
     assert stop_event.is_set()
 
 
-@patch("soundata.display_plot_utils.time.sleep", side_effect=lambda x: None)
-def test_update_line(mock_sleep):
-    # Create mock objects for line1, line2, and fig
+def test_update_line():
+    # Create mock objects for line1, line2, fig and the canvas timer
     line1 = MagicMock()
     line2 = MagicMock()
     fig = MagicMock()
+    timer = MagicMock()
 
     # Shared variables
     playing = [True]
@@ -431,10 +473,9 @@ def test_update_line(mock_sleep):
     current_time_lock = threading.Lock()
     step = 0.1
 
-    # Execute the function in a separate thread
-    update_thread = threading.Thread(
-        target=display_plot_utils.update_line,
-        args=(
+    # Simulate the timer ticks until playback reaches the end
+    for _ in range(int(duration / step) + 1):
+        display_plot_utils.update_line(
             playing,
             current_time,
             duration,
@@ -442,13 +483,11 @@ def test_update_line(mock_sleep):
             line1,
             line2,
             fig,
+            timer,
             step,
-        ),
-    )
-    update_thread.start()
-
-    # Wait for the duration of the test
-    update_thread.join(duration + step)
+        )
+        if not playing[0]:
+            break
 
     # Assertions
     assert not playing[0]
@@ -456,6 +495,16 @@ def test_update_line(mock_sleep):
     line1.set_xdata.assert_called()
     line2.set_xdata.assert_called()
     fig.canvas.draw_idle.assert_called()
+    timer.stop.assert_called_once()
+
+    # A tick after playback was paused only stops the timer
+    line1.reset_mock()
+    timer.reset_mock()
+    display_plot_utils.update_line(
+        playing, current_time, duration, current_time_lock, line1, line2, fig, timer
+    )
+    line1.set_xdata.assert_not_called()
+    timer.stop.assert_called_once()
 
 
 @patch("soundata.display_plot_utils.threading.Thread")
@@ -628,52 +677,44 @@ def test_update_line_exception():
     # Configure one of the mocks to raise an exception
     line1.set_xdata.side_effect = Exception("Test Exception")
 
+    timer = MagicMock()
+
     # Call the function with the mocks
-    with patch("soundata.display_plot_utils.time.sleep", side_effect=lambda x: None):
-        display_plot_utils.update_line(
-            playing, current_time, duration, current_time_lock, line1, line2, fig, step
-        )
+    display_plot_utils.update_line(
+        playing,
+        current_time,
+        duration,
+        current_time_lock,
+        line1,
+        line2,
+        fig,
+        timer,
+        step,
+    )
 
     # Assertions to check if the exception was caught and handled
     line1.set_xdata.assert_called()
+    timer.stop.assert_called_once()
 
 
-@patch("soundata.display_plot_utils.sns.countplot")
-@patch("soundata.display_plot_utils.pd.value_counts")
-def test_plot_distribution(mock_value_counts, mock_countplot):
-    # Mock patches for the plot
-    mock_patches = []
-    for _ in range(3):  # Assuming three patches for simplicity
-        mock_patch = MagicMock()
-        mock_patch.get_width.return_value = 5
-        mock_patch.get_y.return_value = 1
-        mock_patch.get_height.return_value = 0.5
-        mock_patches.append(mock_patch)
-
+def test_plot_distribution():
     # Prepare the data and parameters
-    data = ["A", "B", "A", "C"]
+    data = ["A", "B", "A", "C", "A", "C"]
     title = "Test Title"
     x_label = "X Label"
     y_label = "Y Label"
-    axes = [MagicMock(), MagicMock()]
-    axes[0].patches = mock_patches
-
-    # Mock value_counts to return a specific order
-    mock_value_counts.return_value.index = ["A", "B", "C"]
+    fig, axes = plt.subplots(1, 2)
 
     # Call the function
     display_plot_utils.plot_distribution(data, title, x_label, y_label, axes, 0)
 
-    # Assertions
-    mock_value_counts.assert_called_with(data)
-    mock_countplot.assert_called_with(
-        y=data,
-        order=["A", "B", "C"],
-        palette=["#404040", "#126782", "#C9C9C9"],
-        ax=axes[0],
-    )
-    axes_subplot = axes[0]
-    axes_subplot.set_title.assert_called_with(title, fontsize=8)
-    axes_subplot.set_xlabel.assert_called_with(x_label, fontsize=6)
-    axes_subplot.set_ylabel.assert_called_with(y_label, fontsize=6)
-    axes_subplot.tick_params.assert_called_with(axis="both", which="major", labelsize=6)
+    # Bars are sorted by count, most frequent on top
+    ax = axes[0]
+    assert [p.get_width() for p in ax.patches] == [3, 2, 1]
+    assert [t.get_text() for t in ax.get_yticklabels()] == ["A", "C", "B"]
+    assert ax.yaxis_inverted()
+    assert [t.get_text() for t in ax.texts] == ["3", "2", "1"]
+    assert ax.get_title() == title
+    assert ax.get_xlabel() == x_label
+    assert ax.get_ylabel() == y_label
+    plt.close(fig)
@@ -1,4 +1,5 @@
 import os
+import urllib.error
 from pathlib import Path
 import shutil
 import zipfile
@@ -127,6 +128,20 @@ def test_downloader(mocker, mock_path):
     mock_tar.assert_called_once_with(tar_remote, "a", False, False)
     mocker.resetall()
 
+    # errors raised while downloading concurrently are propagated
+    mock_tar.side_effect = IOError("bad checksum")
+    with pytest.raises(IOError):
+        download_utils.downloader(
+            "a",
+            index=index,
+            remotes={"b": zip_remote, "c": tar_remote, "d": file_remote},
+            max_workers=2,
+        )
+    mock_zip.assert_called_once_with(zip_remote, "a", False, False)
+    mock_download_from_remote.assert_called_once_with(file_remote, "a", False)
+    mock_tar.side_effect = None
+    mocker.resetall()
+
     # Zip multipart
     download_utils.downloader("a", index=index, remotes={"b": multipart_zip_remote})
     mock_multipart_zip.assert_called_once_with(multipart_zip_remote, "a", False, False)
@@ -306,6 +321,24 @@ def test_downloader_with_server_file(httpserver):
 
     _clean(save_dir)
 
+    # concurrent downloads into the same destination_dir
+    remotes = {
+        str(i): download_utils.RemoteFileMetadata(
+            filename="remote{}.wav".format(i),
+            url=httpserver.url,
+            checksum=("3f77d0d69dc41b3696f074ad6bf2852f"),
+            destination_dir="subfolder",
+        )
+        for i in range(8)
+    }
+    download_utils.downloader(save_dir, index=index, remotes=remotes, max_workers=8)
+    assert sorted(os.listdir(os.path.join(save_dir, "subfolder"))) == sorted(
+        "remote{}.wav".format(i) for i in range(8)
+    )
+    assert not download_utils.DownloadProgressBar._positions
+
+    _clean(save_dir)
+
 
 def test_downloader_with_server_zip(httpserver):
     index = core.Index("asdf.json")
@@ -396,6 +429,67 @@ def test_download_from_remote(httpserver, tmpdir):
     download_path = download_utils.download_from_remote(TEST_REMOTE, str(tmpdir), False)
 
 
+def test_download_from_remote_hashes_while_downloading(mocker, httpserver, tmpdir):
+    httpserver.serve_content(open("tests/resources/remote.wav").read())
+    mock_md5 = mocker.spy(download_utils, "md5")
+
+    TEST_REMOTE = download_utils.RemoteFileMetadata(
+        filename="remote.wav",
+        url=httpserver.url,
+        checksum=("3f77d0d69dc41b3696f074ad6bf2852f"),
+    )
+
+    # a fresh download is hashed as it is written
+    download_path = download_utils.download_from_remote(TEST_REMOTE, str(tmpdir), False)
+    mock_md5.assert_not_called()
+
+    # an existing file is hashed from disk
+    download_utils.download_from_remote(TEST_REMOTE, str(tmpdir), False)
+    mock_md5.assert_called_once_with(download_path)
+
+    # a truncated download is an error
+    httpserver.serve_content("abc", headers={"Content-Length": "10"})
+    with pytest.raises(urllib.error.ContentTooShortError):
+        download_utils.download_from_remote(TEST_REMOTE, str(tmpdir), True)
+
+
+def test_download_from_remote_resumes(httpserver, tmpdir):
+    content = open("tests/resources/remote.wav", "rb").read()
+    TEST_REMOTE = download_utils.RemoteFileMetadata(
+        filename="remote.wav",
+        url=httpserver.url,
+        checksum=("3f77d0d69dc41b3696f074ad6bf2852f"),
+    )
+    download_path = os.path.join(str(tmpdir), "remote.wav")
+
+    # the server sends the rest of the file
+    with open(download_path + ".part", "wb") as fhandle:
+        fhandle.write(content[:40])
+    httpserver.serve_content(content[40:], code=206)
+    download_utils.download_from_remote(TEST_REMOTE, str(tmpdir), False)
+    assert httpserver.requests[-1].headers["Range"] == "bytes=40-"
+    assert not os.path.exists(download_path + ".part")
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == content
+
+    # the server ignores the range and sends the whole file
+    os.remove(download_path)
+    with open(download_path + ".part", "wb") as fhandle:
+        fhandle.write(b"x" * 40)
+    httpserver.serve_content(content)
+    download_utils.download_from_remote(TEST_REMOTE, str(tmpdir), False)
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == content
+
+    # force_overwrite discards partial downloads
+    with open(download_path + ".part", "wb") as fhandle:
+        fhandle.write(content[:40])
+    download_utils.download_from_remote(TEST_REMOTE, str(tmpdir), True)
+    assert "Range" not in httpserver.requests[-1].headers
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == content
+
+
 def test_download_from_remote_destdir(httpserver, tmpdir):
     httpserver.serve_content(open("tests/resources/remote.wav").read())
 
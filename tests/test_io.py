@@ -1,6 +1,10 @@
+import os
+import pathlib
 import tempfile
+from unittest import mock
 from io import BufferedReader, BytesIO, StringIO, TextIOWrapper
 
+import numpy as np
 import pytest
 
 from soundata import io
@@ -24,6 +28,16 @@ def test_coerce_to_string_io_with_path():
         func(f.name)
 
 
+def test_coerce_to_string_io_with_pathlike():
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+
+        @io.coerce_to_string_io
+        def func(fh):
+            assert isinstance(fh, TextIOWrapper)
+
+        func(pathlib.Path(f.name))
+
+
 def test_coerce_to_string_io_with_stringio():
     @io.coerce_to_string_io
     def func(fh):
@@ -33,6 +47,15 @@ def test_coerce_to_string_io_with_stringio():
         func(f)
 
 
+def test_coerce_to_string_io_forwards_arguments():
+    @io.coerce_to_string_io
+    def func(fh, a, b=None):
+        return a, b
+
+    with StringIO("abc") as f:
+        assert func(f, 1, b=2) == (1, 2)
+
+
 def test_invalid_coerce_to_string_io():
     @io.coerce_to_string_io
     def func(fh):
@@ -69,6 +92,15 @@ def test_coerce_to_bytes_io_with_bytesio():
         func(f)
 
 
+def test_coerce_to_bytes_io_forwards_arguments():
+    @io.coerce_to_bytes_io
+    def func(fh, a, b=None):
+        return a, b
+
+    with BytesIO(b"abc") as f:
+        assert func(f, 1, b=2) == (1, 2)
+
+
 def test_invalid_coerce_to_bytes_io():
     @io.coerce_to_bytes_io
     def func(fh):
@@ -76,3 +108,96 @@ def test_invalid_coerce_to_bytes_io():
 
     with pytest.raises(ValueError):
         func(123)
+
+
+def test_coerce_to_path_or_bytes_with_none():
+    @io.coerce_to_path_or_bytes_io
+    def func(fh):
+        raise RuntimeError("YOU SHOULDNT BE HERE")
+
+    assert func(None) is None
+
+
+def test_coerce_to_path_or_bytes_io_with_path():
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+
+        @io.coerce_to_path_or_bytes_io
+        def func(fh):
+            assert fh == f.name
+
+        func(f.name)
+        func(pathlib.Path(f.name))
+
+
+def test_coerce_to_path_or_bytes_io_with_bytesio():
+    @io.coerce_to_path_or_bytes_io
+    def func(fh, a, b=None):
+        assert isinstance(fh, BytesIO)
+        return a, b
+
+    with BytesIO(b"abc") as f:
+        assert func(f, 1, b=2) == (1, 2)
+
+
+def test_invalid_coerce_to_path_or_bytes_io():
+    @io.coerce_to_path_or_bytes_io
+    def func(fh):
+        raise RuntimeError("YOU SHOULDNT BE HERE")
+
+    with pytest.raises(ValueError):
+        func(123)
+
+    with pytest.raises(IOError):
+        func("a/fake/filepath")
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "posix_fadvise"), reason="posix_fadvise is not available"
+)
+def test_coerce_to_path_or_bytes_io_advises_readahead():
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+
+        @io.coerce_to_path_or_bytes_io
+        def func(fh):
+            return fh
+
+        with mock.patch("os.posix_fadvise") as fadvise:
+            assert func(f.name) == f.name
+        fadvise.assert_called_once()
+        assert fadvise.call_args[0][1:] == (0, 0, os.POSIX_FADV_WILLNEED)
+
+
+def test_audio_read_dtype():
+    assert io.audio_read_dtype("float32") == "float32"
+    assert io.audio_read_dtype("float16") == "float32"
+    assert io.audio_read_dtype("int16") == "int16"
+    with pytest.raises(ValueError):
+        io.audio_read_dtype("uint8")
+
+
+def test_downmix():
+    audio = np.array([[1.0, 2.0], [3.0, 6.0]])
+    assert np.array_equal(io.downmix(audio, "float64"), [1.5, 4.5])
+    assert np.array_equal(io.downmix(audio[:, 0], "float64"), [1.0, 3.0])
+
+    int_audio = np.array([[1, 2], [-3, -6]], dtype=np.int16)
+    mono = io.downmix(int_audio, "int16")
+    assert mono.dtype == np.int16
+    assert np.array_equal(mono, [2, -4])
+
+
+def test_resample_audio():
+    audio = np.zeros(1000, dtype=np.float32)
+    assert io.resample_audio(audio, 1000, None, "float32") == (audio, 1000)
+    assert io.resample_audio(audio, 1000, 1000, "int16") == (audio, 1000)
+
+    resampled, sr = io.resample_audio(audio, 1000, 500, "float32")
+    assert sr == 500
+    assert resampled.shape == (500,)
+
+    stereo = np.zeros((1000, 2), dtype=np.float32)
+    resampled, sr = io.resample_audio(stereo, 1000, 500, "float32", axis=0)
+    assert resampled.shape == (500, 2)
+
+    with pytest.raises(ValueError):
+        io.resample_audio(audio, 1000, 500, "int16")
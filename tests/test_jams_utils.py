@@ -183,7 +183,7 @@ def test_duration():
 
     # test incomplete metadata
     jam2 = jams_utils.jams_converter(metadata={"artist": "b"})
-    with pytest.raises(jams_utils.jams.SchemaError):
+    with pytest.raises(jams.SchemaError):
         jam2.validate()
 
     # test metadata duration and audio file equal
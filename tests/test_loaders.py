@@ -108,6 +108,7 @@ def test_download(mocker):
             ("partial_download", None),
             ("force_overwrite", False),
             ("cleanup", False),
+            ("max_workers", 1),
         ]
         for exp in expected_params:
             assert exp[0] in params, "{}.download must have {} as a parameter".format(
@@ -341,7 +342,7 @@ def test_load_methods():
             method_name = load_method.__name__
 
             # skip default methods
-            if method_name == "load_clips" or method_name == "load_clipgroups":
+            if method_name in ("load_clips", "load_clipgroups", "load_all_events"):
                 continue
 
             # skip overrides, add to the SKIP dictionary to skip a specific load method